@@ -60,6 +60,7 @@ from pathlib import Path
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 import json
+import os
 
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -285,7 +286,13 @@ class DeploymentHistoryService:
         deployments = []
         count = 0
         
-        for record_path in self.history_path.glob("*.json"):
+        with os.scandir(self.history_path) as entries:
+            record_paths = [
+                entry.path for entry in entries
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+            ]
+            
+        for record_path in record_paths:
             if count >= limit:
                 break
                 
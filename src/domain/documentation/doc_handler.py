@@ -8,6 +8,11 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available, use the pure-Python loader
+    from yaml import SafeLoader
+
 from ..security.audit_log import audit_logger
 from ..security.rate_limiter import RateLimiter
 from ..security.middleware import SecurityMiddleware
@@ -40,8 +45,7 @@ class DocumentationHandler:
     def _load_config(self) -> Dict:
         """Load templates configuration."""
         config_path = self.templates_dir / "templates_config.yaml"
-        with open(config_path, "r") as f:
-            return yaml.safe_load(f)
+        return yaml.load(config_path.read_bytes(), Loader=SafeLoader)
     
     def _setup_jinja(self) -> jinja2.Environment:
         """Setup Jinja2 environment."""
@@ -11,7 +11,7 @@ from typing import Dict, List, Optional, Protocol, Any
 from uuid import UUID, uuid4
 import re
 from abc import ABC, abstractmethod
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
 from src.domain.security.rate_limiter import RateLimiter, RateLimitConfig, rate_limit
 from src.domain.security.audit_log import (
     audit_logger,
@@ -89,6 +89,16 @@ class DeploymentMetadata(BaseModel):
     modified_by: Optional[str] = None
     security_level: SecurityLevel = Field(default=SecurityLevel.READ_ONLY)
     errors: List[Dict] = Field(default_factory=list)
+    _id_str: str = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        """Caches the string form of the id for serialization"""
+        self._id_str = str(self.id)
+
+    @property
+    def id_str(self) -> str:
+        """String form of the metadata id"""
+        return self._id_str
 
     @validator('version')
     def validate_version(cls, v: str) -> str:
@@ -240,6 +250,7 @@ class DeploymentRecord:
     def to_dict(self) -> Dict[str, Any]:
         """Converts deployment record to dictionary with f-strings."""
         return {
+            "id": self.metadata.id_str,
             "deployment_id": self.deployment_id,
             "type": f"{self.deployment_type.value}",
             "strategy": self.deployment_strategy,
@@ -270,7 +281,7 @@ class DeploymentRecord:
                 status="failed",
                 severity=AuditEventSeverity.WARNING,
                 user_id=user_id,
-                resource_id=str(self.metadata.id),
+                resource_id=self.metadata.id_str,
                 details={
                     "required_level": required_level.value if required_level else None,
                     "reason": "Missing user_id or required_level"
@@ -284,7 +295,7 @@ class DeploymentRecord:
                 status="denied",
                 severity=AuditEventSeverity.WARNING,
                 user_id=user_id,
-                resource_id=str(self.metadata.id),
+                resource_id=self.metadata.id_str,
                 details={
                     "required_level": required_level.value,
                     "actual_level": self.metadata.security_level.value
@@ -296,7 +307,7 @@ class DeploymentRecord:
             action="check_access",
             status="granted",
             user_id=user_id,
-            resource_id=str(self.metadata.id),
+            resource_id=self.metadata.id_str,
             details={
                 "required_level": required_level.value,
                 "actual_level": self.metadata.security_level.value
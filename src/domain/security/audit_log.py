@@ -1,13 +1,16 @@
 """Audit logging implementation for security events."""
 
+import atexit
 import json
 import logging
 import os
 import re
+import time
+from collections import deque
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
-from dataclasses import dataclass, field, asdict
+from typing import Any, Deque, Dict, List, Optional
+from dataclasses import dataclass, field
 from uuid import UUID, uuid4
 import threading
 from abc import ABC, abstractmethod
@@ -82,65 +85,77 @@ class AuditEvent:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary format."""
-        data = asdict(self)
-        data['event_id'] = str(data['event_id'])
-        data['timestamp'] = data['timestamp'].isoformat()
-        return data
+        return {
+            'event_id': str(self.event_id),
+            'timestamp': self.timestamp.isoformat(),
+            'event_type': self.event_type,
+            'severity': self.severity,
+            'user_id': self.user_id,
+            'resource_id': self.resource_id,
+            'action': self.action,
+            'status': self.status,
+            'details': self.details,
+            'source_ip': self.source_ip,
+            'metadata': self.metadata,
+        }
 
 class AuditLogHandler(ABC):
-    """Abstract base class for audit log handlers."""
+    """Abstract base class for audit log handlers.
+    
+    Handlers whose ``accepts_raw`` is true are handed the event already
+    serialized by ``serialize_event`` through ``write_raw``, so the JSON
+    line is built once per event however many such handlers there are.
+    """
     
     @abstractmethod
     def log_event(self, event: AuditEvent) -> None:
         """Log an audit event."""
         pass
 
-class FileAuditLogHandler(AuditLogHandler):
-    """Enhanced file audit log handler with security measures."""
-    
-    def __init__(self, filename: str):
-        """Initialize with security checks."""
-        self.filename = sanitize_path(filename)
-        self._lock = threading.Lock()
-        
-        # Ensure proper file permissions
-        if os.path.exists(self.filename):
-            os.chmod(self.filename, 0o640)  # rw-r----- permissions
+    def flush(self) -> None:
+        """Write out any buffered events."""
+        pass
+
+    def close(self) -> None:
+        """Flush pending events and release resources."""
+        self.flush()
+
+    @property
+    def accepts_raw(self) -> bool:
+        """Whether write_raw can take the place of log_event."""
+        return False
+
+    def write_raw(self, payload: bytes, event: AuditEvent) -> None:
+        """Log an event serialized by serialize_event; defaults to log_event."""
+        self.log_event(event)
+
+    @classmethod
+    def serialize_event(cls, event: AuditEvent) -> bytes:
+        """Sanitize an event and encode it as a single JSON line."""
+        try:
+            # Sanitize and validate all string inputs
+            sanitized_data = cls._sanitize_event(event)
             
-        # Ensure directory permissions
-        os.makedirs(os.path.dirname(self.filename), mode=0o750, exist_ok=True)
-    
-    def log_event(self, event: AuditEvent) -> None:
-        """Log event with enhanced security measures."""
-        with self._lock:
-            try:
-                # Sanitize and validate all string inputs
-                sanitized_event = self._sanitize_event(event)
-                
-                # Convert to JSON with proper escaping
-                json_data = json.dumps(
-                    sanitized_event.to_dict(),
-                    default=str,
-                    ensure_ascii=True
-                )
+            # Convert to JSON with proper escaping
+            json_data = json.dumps(
+                sanitized_data,
+                default=str,
+                ensure_ascii=True
+            )
+            return json_data.encode('utf8') + b'\n'
                 
-                # Secure file writing with explicit utf8 encoding
-                with open(self.filename, 'a', encoding='utf8') as f:
-                    os.fchmod(f.fileno(), 0o640)  # Ensure file permissions
-                    f.write(json_data + '\n')
-                    f.flush()
-                    os.fsync(f.fileno())  # Ensure data is written
-                    
-            except IOError as io_err:
-                raise SecurityError("Failed to write to audit log") from io_err
-            except json.JSONDecodeError as json_err:
-                raise SecurityError("Failed to encode audit event") from json_err
-            except Exception as e:
-                raise SecurityError(f"Unexpected error in audit logging: {str(e)}") from e
-    
+        except json.JSONDecodeError as json_err:
+            raise SecurityError("Failed to encode audit event") from json_err
+        except Exception as e:
+            raise SecurityError(f"Unexpected error in audit logging: {str(e)}") from e
+
     @staticmethod
-    def _sanitize_event(event: AuditEvent) -> AuditEvent:
-        """Sanitize event data to prevent XSS and injection."""
+    def _sanitize_event(event: AuditEvent) -> Dict[str, Any]:
+        """Sanitize event data to prevent XSS and injection.
+        
+        Returns the sanitized ``to_dict()`` form of the event, so the
+        timestamp and id are only formatted once per event.
+        """
         try:
             def sanitize_value(value: Any) -> Any:
                 if isinstance(value, str):
@@ -154,17 +169,98 @@ class FileAuditLogHandler(AuditLogHandler):
                     return [sanitize_value(v) for v in value]
                 return value
             
-            # Create a new event with sanitized values
-            event_dict = event.to_dict()
-            sanitized_dict = {
-                k: sanitize_value(v) for k, v in event_dict.items()
+            return {
+                k: sanitize_value(v) for k, v in event.to_dict().items()
             }
             
-            return AuditEvent(**sanitized_dict)
-            
         except Exception as e:
             raise SecurityError("Failed to sanitize audit event") from e
 
+def _defining_class(cls: type, name: str) -> Optional[type]:
+    """Return the class in cls's MRO that defines attribute name."""
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return klass
+    return None
+
+class FileAuditLogHandler(AuditLogHandler):
+    """Enhanced file audit log handler with security measures.
+    
+    Events are buffered in memory and written as one joined batch once
+    ``FLUSH_THRESHOLD`` events are pending or ``FLUSH_INTERVAL`` seconds
+    have passed since the last flush.
+    """
+    
+    FLUSH_THRESHOLD = 64  # Maximum number of buffered events
+    FLUSH_INTERVAL = 0.5  # Maximum seconds between flushes
+    
+    def __init__(self, filename: str):
+        """Initialize with security checks."""
+        self.filename = sanitize_path(filename)
+        self._lock = threading.Lock()
+        self._buffer: List[bytes] = []
+        self._last_flush = time.monotonic()
+        
+        # Ensure directory permissions
+        os.makedirs(os.path.dirname(self.filename), mode=0o750, exist_ok=True)
+        
+        # Keep a single append handle open for the handler's lifetime
+        self._file = open(self.filename, 'ab', buffering=0)
+        os.fchmod(self._file.fileno(), 0o640)  # rw-r----- permissions
+    
+    def log_event(self, event: AuditEvent) -> None:
+        """Log event with enhanced security measures."""
+        self.write_raw(self.serialize_event(event), event)
+    
+    @property
+    def accepts_raw(self) -> bool:
+        # Subclasses that customize logging or serialization must still see
+        # every event, rather than a payload built by the base serializer
+        cls = type(self)
+        return (_defining_class(cls, "log_event") is FileAuditLogHandler
+                and _defining_class(cls, "serialize_event") is AuditLogHandler
+                and _defining_class(cls, "_sanitize_event") is AuditLogHandler)
+    
+    def write_raw(self, payload: bytes, event: AuditEvent) -> None:
+        """Buffer an already serialized event line for writing."""
+        with self._lock:
+            self._buffer.append(payload)
+            if (len(self._buffer) >= self.FLUSH_THRESHOLD
+                    or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL):
+                self._flush_buffer()
+    
+    def flush(self) -> None:
+        """Write all buffered events to the audit log."""
+        with self._lock:
+            self._flush_buffer()
+    
+    def close(self) -> None:
+        """Flush buffered events and close the audit log file."""
+        with self._lock:
+            if self._file.closed:
+                return
+            try:
+                self._flush_buffer()
+            finally:
+                self._file.close()
+    
+    def _flush_buffer(self) -> None:
+        """Write buffered events in one call. Caller must hold the lock."""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        try:
+            # The file is unbuffered, so write the whole batch with as few
+            # syscalls as possible and retry short writes until it is all out
+            data = memoryview(b"".join(self._buffer))
+            while data:
+                data = data[self._file.write(data):]
+            os.fsync(self._file.fileno())  # Ensure data is written
+        except (IOError, ValueError) as io_err:
+            raise SecurityError("Failed to write to audit log") from io_err
+        finally:
+            self._buffer.clear()
+
 class DatabaseAuditLogHandler(AuditLogHandler):
     """Handles audit logging to database."""
     
@@ -178,17 +274,54 @@ class DatabaseAuditLogHandler(AuditLogHandler):
         pass
 
 class AuditLogger:
-    """Main audit logging facility."""
+    """Main audit logging facility.
+    
+    Events are queued and handed to the handlers in batches, either once
+    BATCH_SIZE events are pending or by a background drainer that flushes
+    every FLUSH_INTERVAL seconds, so callers on hot paths never wait on I/O.
+    ``close`` (also run at interpreter exit) stops the drainer, dispatches
+    what is still queued and then flushes and closes the handlers.
+    """
+    BATCH_SIZE = 64
+    FLUSH_INTERVAL = 1.0
     
     def __init__(self):
         self._handlers: list[AuditLogHandler] = []
         self._lock = threading.Lock()
+        self._drain_lock = threading.Lock()
+        self._buffer: Deque[AuditEvent] = deque()
+        self._drainer: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        # One shutdown hook per logger, so the queue drains before handlers close
+        atexit.register(self.close)
     
     def add_handler(self, handler: AuditLogHandler) -> None:
         """Add a new audit log handler."""
         with self._lock:
             self._handlers.append(handler)
     
+    def flush(self) -> None:
+        """Dispatch pending events and flush buffered writes on all handlers."""
+        self._drain()
+        for handler in self._handlers:
+            try:
+                handler.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush audit log handler: {e}")
+    
+    def close(self) -> None:
+        """Stop the drainer, dispatch queued events, then flush and close handlers."""
+        atexit.unregister(self.close)
+        self._stop.set()
+        if self._drainer is not None:
+            self._drainer.join()
+        self._drain()
+        for handler in self._handlers:
+            try:
+                handler.close()
+            except Exception as e:
+                logger.error(f"Failed to close audit log handler: {e}")
+    
     def log_event(self, 
                   event_type: AuditEventType,
                   severity: AuditEventSeverity,
@@ -224,9 +357,43 @@ class AuditLogger:
             metadata=metadata or {}
         )
         
+        self._buffer.append(event)
+        # Once closed no drainer will run, so hand events over right away
+        if len(self._buffer) >= self.BATCH_SIZE or self._stop.is_set():
+            self._drain()
+        elif self._drainer is None:
+            self._start_drainer()
+    
+    def _start_drainer(self) -> None:
+        """Start the background thread that drains the event queue."""
+        with self._lock:
+            if self._drainer is None:
+                self._drainer = threading.Thread(
+                    target=self._drain_loop, name="audit-log-drainer", daemon=True
+                )
+                self._drainer.start()
+    
+    def _drain_loop(self) -> None:
+        while not self._stop.wait(self.FLUSH_INTERVAL):
+            self.flush()
+    
+    def _drain(self) -> None:
+        """Dispatch all queued events to the handlers in order."""
+        with self._drain_lock:
+            while self._buffer:
+                self._dispatch(self._buffer.popleft())
+    
+    def _dispatch(self, event: AuditEvent) -> None:
+        # Raw-accepting handlers share one serialized payload per event
+        payload: Optional[bytes] = None
         for handler in self._handlers:
             try:
-                handler.log_event(event)
+                if handler.accepts_raw:
+                    if payload is None:
+                        payload = AuditLogHandler.serialize_event(event)
+                    handler.write_raw(payload, event)
+                else:
+                    handler.log_event(event)
             except Exception as e:
                 logger.error(f"Failed to log audit event: {e}")
 
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Mapping, Optional, Set
 import json
 import re
 from .audit_log import audit_logger, AuditEventType, AuditEventSeverity
@@ -195,6 +195,17 @@ class ContainerSecurity:
             details={"policy_name": name}
         )
     
+    def add_policies(self, policies: Mapping[str, ContainerPolicy]) -> None:
+        """Add or update several container security policies at once."""
+        self._policies.update(policies)
+        audit_logger.log_event(
+            event_type=AuditEventType.SECURITY,
+            severity=AuditEventSeverity.INFO,
+            action="container_policy_update",
+            status="success",
+            details={"policy_names": list(policies)}
+        )
+    
     def remove_policy(self, name: str) -> None:
         """Remove a container security policy."""
         if name in self._policies:
@@ -2,10 +2,48 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set
+import logging
 import re
 from .audit_log import audit_logger, AuditEventType, AuditEventSeverity
 
+try:
+    import re2
+except ImportError:  # Fall back to the backtracking stdlib engine
+    re2 = None
+
+logger = logging.getLogger(__name__)
+
+# A quantified group that itself contains a quantifier, e.g. "(a+)+"
+_NESTED_QUANTIFIER = re.compile(r'\((?:[^()\\]|\\.)*[+*](?:[^()\\]|\\.)*\)[+*{]')
+
+if re2 is not None:
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.log_errors = False
+
+@lru_cache(maxsize=2048)
+def _compile(pattern: str) -> Any:
+    """Compile a policy pattern once and reuse it for later checks.
+    
+    Patterns are compiled with the linear-time re2 engine when it is
+    installed. Patterns re2 cannot express (e.g. backreferences) fall
+    back to the stdlib ``re`` engine.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern, _RE2_OPTIONS)
+        except re2.error:
+            logger.warning(
+                "Policy pattern %r is not supported by re2, using re", pattern
+            )
+    if _NESTED_QUANTIFIER.search(pattern):
+        logger.warning(
+            "Policy pattern %r contains nested quantifiers and may backtrack "
+            "catastrophically", pattern
+        )
+    return re.compile(pattern)
+
 class Permission(str, Enum):
     """Available permissions in the system."""
     DEPLOY = "deploy"
@@ -125,13 +163,13 @@ class PolicyEnforcer:
         """Check if resource name matches any of the patterns."""
         if not patterns:  # Empty patterns list means match all
             return True
-        return any(re.match(pattern, resource_name) for pattern in patterns)
+        return any(_compile(pattern).match(resource_name) for pattern in patterns)
     
     def _check_conditions(self, context: Dict, conditions: Dict[str, str]) -> bool:
         """Check if context matches all conditions."""
         for key, pattern in conditions.items():
             value = str(context.get(key, ""))
-            if not re.match(pattern, value):
+            if not _compile(pattern).match(value):
                 return False
         return True
 
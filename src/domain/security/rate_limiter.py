@@ -1,5 +1,6 @@
 """Rate limiting implementation for deployment operations."""
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List, Any
@@ -24,7 +25,7 @@ class RateLimitConfig:
 @dataclass
 class RateLimitEntry:
     """Entry for tracking rate limit data."""
-    requests: List[float] = field(default_factory=list)
+    requests: List[float] = field(default_factory=list)  # Ascending time.monotonic() stamps
     last_reset: datetime = field(default_factory=datetime.now)
     group_usage: Dict[str, int] = field(default_factory=dict)
 
@@ -54,12 +55,11 @@ class RateLimiter:
     def check_rate_limit(self, key: str, context: Optional[Dict[str, Any]] = None) -> bool:
         """Check if the rate limit is exceeded for the given key."""
         with self._lock:
-            now = time.time()
+            now = time.monotonic()
             window = self._get_or_create_window(key)
             
             # Clean up old requests
-            cutoff = now - self.config.time_window
-            window.requests = [t for t in window.requests if t > cutoff]
+            self._expire(window, now - self.config.time_window)
             
             # Check group limits if configured
             if self.config.group_key and context:
@@ -95,12 +95,11 @@ class RateLimiter:
     def get_remaining(self, key: str) -> int:
         """Get remaining requests for the given key."""
         with self._lock:
-            now = time.time()
+            now = time.monotonic()
             window = self._get_or_create_window(key)
             
             # Clean up old requests
-            cutoff = now - self.config.time_window
-            window.requests = [t for t in window.requests if t > cutoff]
+            self._expire(window, now - self.config.time_window)
             
             return self.burst_limit - len(window.requests)
     
@@ -110,12 +109,19 @@ class RateLimiter:
             self._windows[key] = RateLimitEntry()
         return self._windows[key]
     
+    @staticmethod
+    def _expire(window: RateLimitEntry, cutoff: float) -> None:
+        """Drop requests at or before cutoff with a single slice deletion."""
+        cut = bisect_right(window.requests, cutoff)
+        if cut:
+            del window.requests[:cut]
+    
     def _get_reset_time(self, window: RateLimitEntry) -> float:
         """Calculate time until the rate limit resets."""
         if not window.requests:
             return 0
-        oldest_request = min(window.requests)
-        return max(0, oldest_request + self.config.time_window - time.time())
+        oldest_request = window.requests[0]
+        return max(0, oldest_request + self.config.time_window - time.monotonic())
     
     def _log_limit_exceeded(self, key: str, group: Optional[str] = None) -> None:
         """Log rate limit exceeded event."""
@@ -138,14 +144,14 @@ class RateLimiter:
     def cleanup(self) -> None:
         """Clean up expired windows."""
         with self._lock:
-            now = time.time()
+            now = time.monotonic()
             cutoff = now - self.config.time_window
             
-            # Remove windows with all requests older than cutoff
-            expired = []
-            for key, window in self._windows.items():
-                if all(t <= cutoff for t in window.requests):
-                    expired.append(key)
+            # Remove windows whose newest request is older than cutoff
+            expired = [
+                key for key, window in self._windows.items()
+                if not window.requests or window.requests[-1] <= cutoff
+            ]
             
             for key in expired:
                 del self._windows[key]
@@ -1,29 +1,46 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 import asyncio
-import json
 import logging
+from collections import Counter, defaultdict
 from pathlib import Path
 
+import msgpack
+
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from domain.models.deployment_model import DeploymentRecord
+from utils import fastjson
 
 class DeploymentHistoryService:
-    """Deployment history service following the enhanced three-iterations approach"""
+    """Deployment history service following the enhanced three-iterations approach
+    
+    Records are stored as an append-only MessagePack log; every change
+    appends a new version and the newest version of a deployment wins.
+    """
+    LOG_FILE = "deployments.msgpack"
+    # Fields read by analyze_deployment_history
+    ANALYSIS_FIELDS = ("id", "status", "type", "stakeholders", "errors")
     
     def __init__(self, history_dir: str):
         self.history_dir = Path(history_dir)
         self.history_dir.mkdir(parents=True, exist_ok=True)
+        self.log_path = self.history_dir / self.LOG_FILE
         self.logger = logging.getLogger(__name__)
+        self._damaged_offset: Optional[int] = None
+        self._index = self._build_index()
+        if not self.log_path.exists():
+            self._migrate_json_records()
+        if self._damaged_offset is not None:
+            self._set_aside_damaged_tail(self._damaged_offset)
         
     # First Iteration - Analysis & Understanding
     async def analyze_deployment_history(self) -> Dict:
         """Analyzes deployment history for patterns and insights"""
         try:
-            deployments = await self._load_all_deployments()
+            deployments = await self._load_all_deployments(self.ANALYSIS_FIELDS)
             
             analysis = {
                 "total_deployments": len(deployments),
@@ -39,10 +56,13 @@ class DeploymentHistoryService:
             
     # Second Iteration - Solution & Implementation
     async def record_deployment(self, deployment: DeploymentRecord) -> str:
-        """Records a new deployment"""
+        """Records a new deployment
+        
+        Returns:
+            The deployment id, for use with get_deployment. All records share
+            one log file, so there is no per-deployment path to return.
+        """
         try:
-            deployment_path = self.history_dir / f"{deployment.deployment_id}.json"
-            
             deployment_data = {
                 "id": deployment.deployment_id,
                 "type": deployment.deployment_type,
@@ -56,10 +76,9 @@ class DeploymentHistoryService:
                 "errors": deployment.errors
             }
             
-            with open(deployment_path, 'w') as f:
-                json.dump(deployment_data, f, indent=2)
+            self._append(deployment_data)
                 
-            return str(deployment_path)
+            return deployment.deployment_id
         except Exception as e:
             self.logger.error(f"Deployment recording failed: {str(e)}")
             raise
@@ -68,25 +87,49 @@ class DeploymentHistoryService:
                                      modified_by: str) -> bool:
         """Updates deployment status"""
         try:
-            deployment_path = self.history_dir / f"{deployment_id}.json"
-            if not deployment_path.exists():
-                raise FileNotFoundError(f"Deployment {deployment_id} not found")
-                
-            with open(deployment_path, 'r') as f:
-                deployment_data = json.load(f)
+            deployment_data = await self.get_deployment(deployment_id)
+            if deployment_data is None:
+                raise LookupError(f"Deployment {deployment_id} not found")
                 
             deployment_data["status"] = new_status
             deployment_data["last_modified"] = datetime.now().isoformat()
             deployment_data["modified_by"] = modified_by
             
-            with open(deployment_path, 'w') as f:
-                json.dump(deployment_data, f, indent=2)
+            self._append(deployment_data)
                 
             return True
         except Exception as e:
             self.logger.error(f"Status update failed: {str(e)}")
             return False
             
+    async def get_deployment(self, deployment_id: str) -> Optional[Dict]:
+        """Gets the latest version of a deployment record"""
+        offset = self._index.get(deployment_id)
+        if offset is None:
+            return None
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            return msgpack.Unpacker(f).unpack()
+            
+    async def import_records(self, records: Iterable[Dict]) -> int:
+        """Appends raw deployment records, e.g. from legacy JSON files"""
+        count = 0
+        for record in records:
+            self._append(record)
+            count += 1
+        return count
+        
+    async def export_json(self, output_dir: str) -> List[str]:
+        """Exports the latest version of each deployment as a JSON file"""
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        exported = []
+        for deployment in self._read_latest():
+            file_path = output_path / f"{deployment['id']}.json"
+            file_path.write_bytes(fastjson.dumps(deployment))
+            exported.append(str(file_path))
+        return exported
+            
     # Third Iteration - Enhancement & Optimization
     async def generate_deployment_metrics(self) -> Dict:
         """Generates comprehensive deployment metrics"""
@@ -110,7 +153,7 @@ class DeploymentHistoryService:
             optimization_results = {
                 "compressed": await self._compress_old_records(),
                 "indexed": await self._create_deployment_index(),
-                "cleaned": await self._clean_invalid_records()
+                "cleaned": self._clean_invalid_records()
             }
             
             return optimization_results
@@ -119,17 +162,123 @@ class DeploymentHistoryService:
             raise
             
     # Helper methods
-    async def _load_all_deployments(self) -> List[Dict]:
-        """Loads all deployment records"""
-        deployments = []
-        for file_path in self.history_dir.glob("*.json"):
+    async def _load_all_deployments(self, fields: Optional[Tuple[str, ...]] = None) -> List[Dict]:
+        """Loads the latest version of all deployment records
+        
+        With fields, each record is trimmed to those keys as soon as it is
+        decoded, so large unused values are not kept alive.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._read_latest, fields)
+    
+    def _scan_log(self) -> Iterator[Tuple[int, Dict]]:
+        """Yields (offset, record) for every readable record version in log order
+        
+        Records without an id are skipped, and reading stops at data that
+        cannot be decoded; both are logged rather than raised so one bad
+        write cannot make the whole history unreadable. The offset where
+        reading stopped is kept in _damaged_offset.
+        """
+        self._damaged_offset = None
+        try:
+            f = open(self.log_path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            unpacker = msgpack.Unpacker(f)
+            offset = 0
+            while True:
+                try:
+                    record = unpacker.unpack()
+                except msgpack.OutOfData:
+                    if offset < os.fstat(f.fileno()).st_size:
+                        self.logger.warning(
+                            f"Ignoring incomplete deployment record at offset {offset}"
+                        )
+                        self._damaged_offset = offset
+                    return
+                except (ValueError, TypeError, msgpack.UnpackException) as e:
+                    self.logger.warning(
+                        f"Stopping at corrupt deployment log data at offset {offset}: {str(e)}"
+                    )
+                    self._damaged_offset = offset
+                    return
+                if isinstance(record, dict) and "id" in record:
+                    yield offset, record
+                else:
+                    self.logger.warning(
+                        f"Skipping deployment record without an id at offset {offset}"
+                    )
+                offset = unpacker.tell()
+    
+    def _migrate_json_records(self) -> None:
+        """Imports <id>.json records written before the log existed
+        
+        Runs only while there is no log yet; the JSON files are left in
+        place. Unreadable files are logged and skipped, as before.
+        """
+        with os.scandir(self.history_dir) as entries:
+            json_paths = sorted(
+                entry.path for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            )
+        imported = 0
+        for file_path in json_paths:
             try:
-                with open(file_path, 'r') as f:
-                    deployment_data = json.load(f)
-                    deployments.append(deployment_data)
+                with open(file_path, "rb") as f:
+                    self._append(fastjson.loads(f.read()))
+                imported += 1
             except Exception as e:
                 self.logger.warning(f"Failed to load deployment {file_path}: {str(e)}")
-        return deployments
+        if imported:
+            self.logger.info(f"Imported {imported} JSON deployment records into {self.log_path}")
+            
+    def _set_aside_damaged_tail(self, offset: int) -> None:
+        """Moves log bytes from offset onwards to a side file and truncates the log
+        
+        Without this, records appended after damaged data would be written
+        past the point where reading stops, and lost on the next start.
+        """
+        damaged_path = self.log_path.with_name(
+            f"{self.LOG_FILE}.damaged-{datetime.now():%Y%m%d%H%M%S%f}"
+        )
+        with open(self.log_path, "r+b") as f:
+            f.seek(offset)
+            damaged_path.write_bytes(f.read())
+            f.truncate(offset)
+        self._damaged_offset = None
+        self.logger.warning(
+            f"Moved damaged deployment log data from offset {offset} to {damaged_path}"
+        )
+    
+    def _iter_log(self) -> Iterator[Dict]:
+        """Yields every record version in log order with one sequential read"""
+        for _, record in self._scan_log():
+            yield record
+            
+    def _read_latest(self, fields: Optional[Tuple[str, ...]] = None) -> List[Dict]:
+        """Collapses the log to the newest version of each deployment"""
+        latest = {}
+        for record in self._iter_log():
+            if fields is not None:
+                record = {key: record[key] for key in fields if key in record}
+            latest[record["id"]] = record
+        return list(latest.values())
+        
+    def _build_index(self) -> Dict[str, int]:
+        """Maps each deployment id to the offset of its newest version"""
+        return {record["id"]: offset for offset, record in self._scan_log()}
+        
+    def _append(self, record: Dict) -> int:
+        """Appends a record version to the log and indexes it"""
+        # Check before writing, so a bad record never reaches the log
+        if not isinstance(record, dict) or "id" not in record:
+            raise ValueError("Deployment record has no id")
+        with open(self.log_path, "ab") as f:
+            offset = f.tell()
+            f.write(msgpack.packb(record))
+        self._index[record["id"]] = offset
+        return offset
         
     def _calculate_success_rate(self, deployments: List[Dict]) -> float:
         """Calculates deployment success rate"""
@@ -141,22 +290,19 @@ class DeploymentHistoryService:
         
     def _identify_common_errors(self, deployments: List[Dict]) -> Dict[str, int]:
         """Identifies common deployment errors"""
-        error_counts = {}
-        for deployment in deployments:
-            for error in deployment.get("errors", []):
-                error_type = error["type"]
-                error_counts[error_type] = error_counts.get(error_type, 0) + 1
-        return error_counts
+        return dict(Counter(
+            error["type"]
+            for deployment in deployments
+            for error in deployment.get("errors", [])
+        ))
         
     def _analyze_stakeholder_impact(self, deployments: List[Dict]) -> Dict[str, List[str]]:
         """Analyzes deployment impact on stakeholders"""
-        impact_map = {}
+        impact_map = defaultdict(list)
         for deployment in deployments:
             for stakeholder in deployment.get("stakeholders", []):
-                if stakeholder not in impact_map:
-                    impact_map[stakeholder] = []
                 impact_map[stakeholder].append(deployment["id"])
-        return impact_map
+        return dict(impact_map)
         
     def _calculate_performance_metrics(self, deployments: List[Dict]) -> Dict:
         """Calculates deployment performance metrics"""
@@ -176,10 +322,15 @@ class DeploymentHistoryService:
         
     def _analyze_deployment_trends(self, deployments: List[Dict]) -> Dict:
         """Analyzes deployment trends over time"""
+        # Bucket every record by month once and share it across the trends
+        months = [
+            datetime.fromisoformat(deployment["created_at"]).strftime("%Y-%m")
+            for deployment in deployments
+        ]
         return {
-            "frequency": self._calculate_deployment_frequency(deployments),
-            "success_trend": self._calculate_success_trend(deployments),
-            "complexity_trend": self._calculate_complexity_trend(deployments)
+            "frequency": self._calculate_deployment_frequency(months),
+            "success_trend": self._calculate_success_trend(deployments, months),
+            "complexity_trend": self._calculate_complexity_trend(deployments, months)
         }
         
     def _calculate_average_duration(self, deployments: List[Dict]) -> float:
@@ -196,28 +347,23 @@ class DeploymentHistoryService:
         
     def _calculate_success_by_type(self, deployments: List[Dict]) -> Dict[str, float]:
         """Calculates success rate by deployment type"""
-        type_stats = {}
-        for deployment in deployments:
-            dep_type = deployment.get("type", "unknown")
-            if dep_type not in type_stats:
-                type_stats[dep_type] = {"total": 0, "success": 0}
-            type_stats[dep_type]["total"] += 1
-            if deployment.get("status") == "completed":
-                type_stats[dep_type]["success"] += 1
-                
+        totals = Counter(deployment.get("type", "unknown") for deployment in deployments)
+        successes = Counter(
+            deployment.get("type", "unknown") for deployment in deployments
+            if deployment.get("status") == "completed"
+        )
         return {
-            dep_type: stats["success"] / stats["total"]
-            for dep_type, stats in type_stats.items()
+            dep_type: successes[dep_type] / total
+            for dep_type, total in totals.items()
         }
         
     def _calculate_error_frequency(self, deployments: List[Dict]) -> Dict[str, int]:
         """Calculates frequency of different error types"""
-        error_counts = {}
-        for deployment in deployments:
-            for error in deployment.get("errors", []):
-                error_type = error.get("type", "unknown")
-                error_counts[error_type] = error_counts.get(error_type, 0) + 1
-        return error_counts
+        return dict(Counter(
+            error.get("type", "unknown")
+            for deployment in deployments
+            for error in deployment.get("errors", [])
+        ))
         
     def _calculate_mtbf(self, deployments: List[Dict]) -> float:
         """Calculates Mean Time Between Failures"""
@@ -254,71 +400,69 @@ class DeploymentHistoryService:
         successful = sum(1 for d in deployments if d.get("status") == "completed")
         return (successful / total_deployments) * 100
         
-    def _calculate_deployment_frequency(self, deployments: List[Dict]) -> Dict[str, int]:
+    def _calculate_deployment_frequency(self, months: List[str]) -> Dict[str, int]:
         """Calculates deployment frequency over time"""
-        frequency = {}
-        for deployment in deployments:
-            date = datetime.fromisoformat(deployment["created_at"]).strftime("%Y-%m")
-            frequency[date] = frequency.get(date, 0) + 1
-        return frequency
+        return dict(Counter(months))
         
-    def _calculate_success_trend(self, deployments: List[Dict]) -> Dict[str, float]:
+    def _calculate_success_trend(self, deployments: List[Dict],
+                                 months: List[str]) -> Dict[str, float]:
         """Calculates success rate trend over time"""
-        trend = {}
-        for deployment in deployments:
-            date = datetime.fromisoformat(deployment["created_at"]).strftime("%Y-%m")
-            if date not in trend:
-                trend[date] = {"total": 0, "success": 0}
-            trend[date]["total"] += 1
-            if deployment.get("status") == "completed":
-                trend[date]["success"] += 1
-                
+        totals = Counter(months)
+        successes = Counter(
+            month for month, deployment in zip(months, deployments)
+            if deployment.get("status") == "completed"
+        )
         return {
-            date: stats["success"] / stats["total"]
-            for date, stats in trend.items()
+            date: successes[date] / total
+            for date, total in totals.items()
         }
         
-    def _calculate_complexity_trend(self, deployments: List[Dict]) -> Dict[str, float]:
+    def _calculate_complexity_trend(self, deployments: List[Dict],
+                                    months: List[str]) -> Dict[str, float]:
         """Calculates deployment complexity trend over time"""
-        trend = {}
-        for deployment in deployments:
-            date = datetime.fromisoformat(deployment["created_at"]).strftime("%Y-%m")
-            complexity = len(deployment.get("implementation_steps", [])) + \
-                        len(deployment.get("validation_results", {})) + \
-                        len(deployment.get("errors", []))
-            if date not in trend:
-                trend[date] = {"total": 0, "count": 0}
-            trend[date]["total"] += complexity
-            trend[date]["count"] += 1
-                
+        counts = Counter(months)
+        totals = Counter()
+        for month, deployment in zip(months, deployments):
+            totals[month] += len(deployment.get("implementation_steps", [])) + \
+                            len(deployment.get("validation_results", {})) + \
+                            len(deployment.get("errors", []))
         return {
-            date: stats["total"] / stats["count"]
-            for date, stats in trend.items()
+            date: totals[date] / count
+            for date, count in counts.items()
         }
         
     async def _compress_old_records(self) -> Dict:
-        """Compresses old deployment records"""
-        compressed_count = 0
-        total_size_saved = 0
-        # Implementation details for compression
+        """Compacts the log down to the latest version of each deployment"""
+        if not self.log_path.exists():
+            return {"compressed_count": 0, "total_size_saved": 0}
+            
+        original_size = self.log_path.stat().st_size
+        versions = 0
+        latest = {}
+        for record in self._iter_log():
+            latest[record["id"]] = record
+            versions += 1
+        
+        index = {}
+        temp_path = self.log_path.with_suffix(".tmp")
+        with open(temp_path, "wb") as f:
+            for record in latest.values():
+                index[record["id"]] = f.tell()
+                f.write(msgpack.packb(record))
+        os.replace(temp_path, self.log_path)
+        self._index = index
+        
         return {
-            "compressed_count": compressed_count,
-            "total_size_saved": total_size_saved
+            "compressed_count": versions - len(latest),
+            "total_size_saved": original_size - self.log_path.stat().st_size
         }
         
     async def _create_deployment_index(self) -> Dict:
         """Creates an index for faster deployment lookups"""
-        index = {}
-        for file_path in self.history_dir.glob("*.json"):
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    index[data["id"]] = str(file_path)
-            except Exception as e:
-                self.logger.warning(f"Failed to index {file_path}: {str(e)}")
-        return index
+        self._index = self._build_index()
+        return dict(self._index)
         
-    async def _clean_invalid_records(self) -> Dict:
+    def _clean_invalid_records(self) -> Dict:
         """Cleans invalid deployment records"""
         cleaned_count = 0
         error_count = 0
@@ -16,11 +16,18 @@ class GitService:
     async def analyze_repository(self) -> Dict:
         """Analyzes repository state and history"""
         try:
+            # Read-only queries, so the git processes can run concurrently
+            branch, changes, commits, contributors = await asyncio.gather(
+                self._get_current_branch(),
+                self._get_uncommitted_changes(),
+                self._get_recent_commits(),
+                self._get_contributors()
+            )
             analysis = {
-                "current_branch": await self._get_current_branch(),
-                "uncommitted_changes": await self._get_uncommitted_changes(),
-                "recent_commits": await self._get_recent_commits(),
-                "contributors": await self._get_contributors()
+                "current_branch": branch,
+                "uncommitted_changes": changes,
+                "recent_commits": commits,
+                "contributors": contributors
             }
             return analysis
         except Exception as e:
@@ -131,10 +138,15 @@ class GitService:
     async def analyze_performance(self) -> Dict:
         """Analyzes repository performance"""
         try:
+            size, object_count, largest_files = await asyncio.gather(
+                self._get_repo_size(),
+                self._get_object_count(),
+                self._get_largest_files()
+            )
             performance_metrics = {
-                "size": await self._get_repo_size(),
-                "object_count": await self._get_object_count(),
-                "largest_files": await self._get_largest_files()
+                "size": size,
+                "object_count": object_count,
+                "largest_files": largest_files
             }
             return performance_metrics
         except Exception as e:
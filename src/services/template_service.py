@@ -1,12 +1,14 @@
-from typing import Dict, List, Optional, Any, Protocol, Callable
+from typing import Dict, List, Optional, Any, Protocol, Callable, Iterable
 from datetime import datetime
 import asyncio
 import json
 import logging
+import time
 from pathlib import Path
 from enum import Enum
 from dataclasses import dataclass
 from functools import wraps
+from itertools import chain
 from abc import ABC, abstractmethod
 
 import sys
@@ -15,6 +17,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from domain.models.config_model import ConfigModel
 
+_LOGGER = logging.getLogger(__name__)
+
 class TemplateStatus(str, Enum):
     """Template status states"""
     DRAFT = "draft"
@@ -22,6 +26,8 @@ class TemplateStatus(str, Enum):
     DEPRECATED = "deprecated"
     ARCHIVED = "archived"
 
+_DEFAULT_STATUS = TemplateStatus.DRAFT
+
 class TemplateError(Exception):
     """Base exception for template operations"""
     def __init__(self, message: str, context: Optional[Dict] = None):
@@ -36,9 +42,11 @@ class LoggerProtocol(Protocol):
 
 class OperationContext:
     """Context for template operations"""
+    __slots__ = ("operation", "start_ns", "context", "error")
+    
     def __init__(self, operation: str, **kwargs):
         self.operation = operation
-        self.start_time = datetime.now()
+        self.start_ns = time.monotonic_ns()
         self.context = kwargs
         self.error: Optional[Exception] = None
         
@@ -48,7 +56,7 @@ class OperationContext:
         self.context["error_type"] = error.__class__.__name__
         
     def get_duration(self) -> float:
-        return (datetime.now() - self.start_time).total_seconds()
+        return (time.monotonic_ns() - self.start_ns) / 1e9
         
     def to_dict(self) -> Dict:
         return {
@@ -65,11 +73,11 @@ class ValidationStrategy(ABC):
     
 class TemplateValidator(ValidationStrategy):
     """Validates template structure and required fields"""
-    def __init__(self, required_fields: List[str]):
-        self.required_fields = required_fields
+    def __init__(self, required_fields: Iterable[str]):
+        self.required_fields = frozenset(required_fields)
         
     def validate(self, data: Dict) -> bool:
-        return all(field in data for field in self.required_fields)
+        return self.required_fields.issubset(data)
 
 class StrategiesValidator(ValidationStrategy):
     """Validates strategies section of template"""
@@ -84,20 +92,26 @@ def with_operation_context(operation_name: str):
             context = OperationContext(operation_name, **kwargs)
             try:
                 result = await func(self, *args, **kwargs, context=context)
-                self.logger.info(f"{operation_name} completed", 
-                               extra=context.to_dict())
+                if _LOGGER.isEnabledFor(logging.INFO):
+                    _LOGGER.info("%s completed", operation_name,
+                                 extra=context.to_dict())
                 return result
             except Exception as e:
                 context.set_error(e)
-                self.logger.error(f"{operation_name} failed: {str(e)}", 
-                                extra=context.to_dict())
-                raise TemplateError(str(e), context=context.to_dict())
+                details = context.to_dict()
+                _LOGGER.error("%s failed: %s", operation_name, e, extra=details)
+                raise TemplateError(str(e), context=details)
         return wrapper
     return decorator
 
-@dataclass
+@dataclass(frozen=True)
 class TemplateAnalysis:
     """Structured analysis results with metrics"""
+    __slots__ = (
+        "stakeholders", "objectives", "gaps",
+        "current_state", "complexity_score", "metrics"
+    )
+    
     stakeholders: List[str]
     objectives: List[str]
     gaps: Dict[str, str]
@@ -109,16 +123,20 @@ class TemplateService:
     """Template service with enhanced error handling and validation"""
     
     # Class-level constants
-    REQUIRED_FIELDS = ["name", "description", "created_at"]
-    REQUIRED_SECTIONS = ["validation", "integration", "security"]
+    REQUIRED_FIELDS = frozenset({"name", "description", "created_at"})
+    SECTION_ORDER = ("validation", "integration", "security")
+    REQUIRED_SECTIONS = frozenset(SECTION_ORDER)
     
     def __init__(self, template_dir: str):
         self.template_dir = Path(template_dir)
-        self.logger = logging.getLogger(__name__)
         self.validators = [
-            TemplateValidator(["name", "description", "created_at"]),
+            TemplateValidator(self.REQUIRED_FIELDS),
             StrategiesValidator()
         ]
+        self._validator_dispatch = tuple(
+            (validator.__class__.__name__, validator.validate)
+            for validator in self.validators
+        )
         
     async def _load_template(self, template_name: str, context: OperationContext) -> Dict:
         """Loads and validates template existence with context"""
@@ -127,10 +145,9 @@ class TemplateService:
             raise TemplateError(f"Template {template_name} not found")
             
         async with asyncio.Lock():
-            with open(template_path, 'r') as f:
-                data = json.load(f)
-                context.context["template_size"] = len(json.dumps(data))
-                return data
+            raw = template_path.read_bytes()
+            context.context["template_size"] = len(raw)
+            return json.loads(raw)
                 
     @with_operation_context("analyze_template")
     async def analyze_template(self, template_name: str, *, context: OperationContext) -> TemplateAnalysis:
@@ -154,13 +171,24 @@ class TemplateService:
         """Validates template using validation strategies"""
         template_data = await self._load_template(template_name, context)
         
-        results = {
-            validator.__class__.__name__: validator.validate(template_data)
-            for validator in self.validators
-        }
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            results = self._run_validators(template_data)
+            context.context["validation_results"] = results
+            return all(results.values())
+        return all(validate(template_data) for _, validate in self._validator_dispatch)
+    
+    @with_operation_context("explain_validation")
+    async def explain_validation(self, template_name: str, *, context: OperationContext) -> Dict[str, bool]:
+        """Runs every validation strategy and returns the per-validator results"""
+        template_data = await self._load_template(template_name, context)
         
+        results = self._run_validators(template_data)
         context.context["validation_results"] = results
-        return all(results.values())
+        return results
+    
+    def _run_validators(self, template_data: Dict) -> Dict[str, bool]:
+        """Collects the result of each validator"""
+        return {name: validate(template_data) for name, validate in self._validator_dispatch}
     
     @with_operation_context("create_template")
     async def create_template(self, config: ConfigModel, *, context: OperationContext) -> str:
@@ -190,25 +218,25 @@ class TemplateService:
         return {
             "complexity_score": len(json.dumps(data)) / 1000.0,
             "field_count": sum(1 for _ in self._traverse_dict(data)),
-            "depth": max(self._calculate_depth(data), default=0),
+            "depth": self._calculate_depth(data),
             "validation_coverage": self._calculate_validation_coverage(data)
         }
     
-    def _calculate_depth(self, data: Dict, current_depth: int = 0) -> List[int]:
+    def _calculate_depth(self, data: Dict) -> int:
         """Calculates maximum nesting depth"""
         if not isinstance(data, dict):
-            return [current_depth]
-            
-        if not data:
-            return [current_depth + 1]
+            return 0
             
-        depths = []
-        for value in data.values():
-            if isinstance(value, dict):
-                depths.extend(self._calculate_depth(value, current_depth + 1))
-            else:
-                depths.append(current_depth + 1)
-        return depths
+        stack = [(data, 1)]
+        max_depth = 0
+        while stack:
+            node, depth = stack.pop()
+            if depth > max_depth:
+                max_depth = depth
+            for value in node.values():
+                if isinstance(value, dict):
+                    stack.append((value, depth + 1))
+        return max_depth
     
     def _traverse_dict(self, data: Dict) -> Dict:
         """Traverses dictionary using generator expression"""
@@ -220,13 +248,11 @@ class TemplateService:
         
     def _identify_stakeholders(self, template_data: Dict) -> List[str]:
         """Identifies stakeholders from template data"""
-        stakeholders = set()
-        if "access" in template_data:
-            stakeholders.update(template_data["access"].keys())
-        if "workflows" in template_data:
-            for workflow in template_data["workflows"]:
-                stakeholders.update(workflow.get("participants", []))
-        return list(stakeholders)
+        access = template_data.get("access") or {}
+        workflows = template_data.get("workflows") or ()
+        return list(set(access).union(
+            chain.from_iterable(w.get("participants", ()) for w in workflows)
+        ))
         
     def _extract_objectives(self, template_data: Dict) -> List[str]:
         """Extracts objectives from template data"""
@@ -237,20 +263,23 @@ class TemplateService:
         
     def _analyze_gaps(self, template_data: Dict) -> Dict[str, str]:
         """Analyzes gaps in template implementation"""
+        missing = self.REQUIRED_SECTIONS - template_data.keys()
+        # Build the result in SECTION_ORDER so it serializes the same every run
         return {
-            section: "Missing implementation" if section not in template_data
-            else "Empty implementation" if not template_data[section]
-            else ""
-            for section in self.REQUIRED_SECTIONS
-            if section not in template_data or not template_data[section]
+            section: "Missing implementation" if section in missing else "Empty implementation"
+            for section in self.SECTION_ORDER
+            if section in missing or not template_data[section]
         }
         
     def _assess_current_state(self, template_data: Dict) -> Dict[str, Any]:
         """Assesses current state of template"""
+        last_modified = template_data.get("last_modified")
+        if last_modified is None:
+            last_modified = datetime.now().isoformat()
         return {
             "version": template_data.get("version", "1.0.0"),
-            "last_modified": template_data.get("last_modified", datetime.now().isoformat()),
-            "status": template_data.get("status", TemplateStatus.DRAFT)
+            "last_modified": last_modified,
+            "status": template_data.get("status", _DEFAULT_STATUS)
         }
         
     def _calculate_validation_coverage(self, template_data: Dict) -> float:
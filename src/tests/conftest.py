@@ -1,5 +1,20 @@
 import pytest
+import asyncio
 import logging
+from pathlib import Path
+
+@pytest.fixture(scope="session", autouse=True)
+def uvloop_policy():
+    """Runs async tests on uvloop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:  # Not available on Windows
+        yield
+        return
+    original = asyncio.get_event_loop_policy()
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    yield
+    asyncio.set_event_loop_policy(original)
 
 @pytest.fixture(autouse=True)
 def setup_logging():
@@ -8,3 +23,9 @@ def setup_logging():
         level=logging.DEBUG,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
+
+@pytest.fixture
+def fast_fs(fs):
+    """In-memory filesystem root for tests that only need scratch files"""
+    fs.create_dir("/fake")
+    return Path("/fake")
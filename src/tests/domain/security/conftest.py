@@ -0,0 +1,14 @@
+"""Shared fixtures for security tests."""
+
+import pytest
+from unittest.mock import patch
+
+@pytest.fixture
+def audit_events():
+    """Record the keyword arguments of every audit event logged during a test."""
+    events = []
+    with patch(
+        'src.domain.security.audit_log.audit_logger.log_event',
+        new=lambda **event: events.append(event)
+    ):
+        yield events
@@ -2,15 +2,19 @@
 
 import json
 import os
+import time
 import pytest
 from datetime import datetime
+from unittest.mock import Mock, patch
 from uuid import UUID
 from src.domain.security.audit_log import (
     AuditLogger,
     AuditEvent,
     AuditEventType,
     AuditEventSeverity,
+    AuditLogHandler,
     FileAuditLogHandler,
+    SecurityConfig,
     setup_file_logging,
     log_security_event,
     log_deployment_event
@@ -27,7 +31,8 @@ def audit_logger(temp_log_file):
     logger = AuditLogger()
     handler = FileAuditLogHandler(temp_log_file)
     logger.add_handler(handler)
-    return logger
+    yield logger
+    logger.close()
 
 def test_audit_event_creation():
     """Test creating an audit event."""
@@ -71,6 +76,7 @@ def test_file_logging(audit_logger, temp_log_file):
         status="success"
     )
     audit_logger.log_event(event)
+    audit_logger.flush()
     
     # Verify log file content
     assert os.path.exists(temp_log_file), "Log file should exist"
@@ -80,7 +86,7 @@ def test_file_logging(audit_logger, temp_log_file):
         assert log_entry["severity"] == AuditEventSeverity.INFO.value
         assert log_entry["action"] == "test_action"
 
-def test_multiple_handlers(temp_log_file):
+def test_multiple_handlers(temp_log_file, request):
     """Test using multiple handlers."""
     # Create logger with two handlers
     logger = AuditLogger()
@@ -88,6 +94,7 @@ def test_multiple_handlers(temp_log_file):
     handler2 = FileAuditLogHandler(temp_log_file + "2")
     logger.add_handler(handler1)
     logger.add_handler(handler2)
+    request.addfinalizer(logger.close)
     
     # Log test event
     logger.log_event(
@@ -96,6 +103,7 @@ def test_multiple_handlers(temp_log_file):
         action="test_action",
         status="success"
     )
+    logger.flush()
     
     # Verify both log files
     for suffix, filename in [("1", temp_log_file + "1"), ("2", temp_log_file + "2")]:
@@ -106,6 +114,188 @@ def test_multiple_handlers(temp_log_file):
             assert log_entry["severity"] == AuditEventSeverity.INFO.value
             assert log_entry["action"] == "test_action"
 
+def test_buffered_writes(tmp_path, monkeypatch):
+    """Test that events are buffered until flushed."""
+    monkeypatch.setattr(SecurityConfig, "SECURE_PATHS", {"logs": str(tmp_path)})
+    log_file = tmp_path / "buffered_audit.log"
+    handler = FileAuditLogHandler(str(log_file))
+    monkeypatch.setattr(handler, "FLUSH_INTERVAL", 60)
+    
+    event = AuditEvent(action="test_action", status="success")
+    for _ in range(handler.FLUSH_THRESHOLD - 1):
+        handler.log_event(event)
+    assert log_file.read_text() == "", "Events should be buffered"
+    
+    # Reaching the threshold writes the whole batch
+    handler.log_event(event)
+    assert len(log_file.read_text().splitlines()) == handler.FLUSH_THRESHOLD
+    
+    handler.log_event(event)
+    handler.close()
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == handler.FLUSH_THRESHOLD + 1
+    assert json.loads(lines[-1])["action"] == "test_action"
+
+def test_handlers_share_serialized_event(tmp_path, monkeypatch, request):
+    """Test that an event is serialized once for all file handlers."""
+    monkeypatch.setattr(SecurityConfig, "SECURE_PATHS", {"logs": str(tmp_path)})
+    logger = AuditLogger()
+    handlers = [FileAuditLogHandler(str(tmp_path / f"audit{i}.log")) for i in range(2)]
+    for handler in handlers:
+        logger.add_handler(handler)
+    request.addfinalizer(logger.close)
+    
+    with patch.object(
+        AuditLogHandler, "serialize_event",
+        wraps=AuditLogHandler.serialize_event
+    ) as mock_serialize:
+        logger.log_event(
+            event_type=AuditEventType.SECURITY,
+            severity=AuditEventSeverity.INFO,
+            action="test_action",
+            status="success"
+        )
+        logger.flush()
+    
+    assert mock_serialize.call_count == 1
+    first, second = ((tmp_path / f"audit{i}.log").read_text() for i in range(2))
+    assert first == second
+    assert json.loads(first)["action"] == "test_action"
+
+def test_subclass_log_event_not_bypassed(tmp_path, monkeypatch, request):
+    """Test that a file handler overriding log_event still sees every event."""
+    monkeypatch.setattr(SecurityConfig, "SECURE_PATHS", {"logs": str(tmp_path)})
+    
+    class RedactingHandler(FileAuditLogHandler):
+        def log_event(self, event: AuditEvent) -> None:
+            event.user_id = "redacted"
+            super().log_event(event)
+    
+    logger = AuditLogger()
+    handler = RedactingHandler(str(tmp_path / "audit.log"))
+    logger.add_handler(handler)
+    request.addfinalizer(logger.close)
+    logger.log_event(
+        event_type=AuditEventType.SECURITY,
+        severity=AuditEventSeverity.INFO,
+        action="test_action",
+        status="success",
+        user_id="alice"
+    )
+    logger.flush()
+    
+    assert json.loads((tmp_path / "audit.log").read_text())["user_id"] == "redacted"
+
+def test_subclass_serializer_not_bypassed(tmp_path, monkeypatch, request):
+    """Test that a file handler with its own sanitizer still sanitizes events."""
+    monkeypatch.setattr(SecurityConfig, "SECURE_PATHS", {"logs": str(tmp_path)})
+    
+    class RedactingHandler(FileAuditLogHandler):
+        @staticmethod
+        def _sanitize_event(event: AuditEvent):
+            return {**FileAuditLogHandler._sanitize_event(event), "user_id": "redacted"}
+    
+    logger = AuditLogger()
+    logger.add_handler(FileAuditLogHandler(str(tmp_path / "plain.log")))
+    logger.add_handler(RedactingHandler(str(tmp_path / "redacted.log")))
+    request.addfinalizer(logger.close)
+    logger.log_event(
+        event_type=AuditEventType.SECURITY,
+        severity=AuditEventSeverity.INFO,
+        action="test_action",
+        status="success",
+        user_id="alice"
+    )
+    logger.flush()
+    
+    assert json.loads((tmp_path / "plain.log").read_text())["user_id"] == "alice"
+    assert json.loads((tmp_path / "redacted.log").read_text())["user_id"] == "redacted"
+
+def test_batched_dispatch(request):
+    """Test that events are queued and dispatched in batches."""
+    logger = AuditLogger()
+    logger.FLUSH_INTERVAL = 60  # Keep the background drainer out of the way
+    handler = Mock(spec=AuditLogHandler, accepts_raw=False)
+    logger.add_handler(handler)
+    request.addfinalizer(logger.close)
+    
+    for _ in range(logger.BATCH_SIZE - 1):
+        logger.log_event(
+            event_type=AuditEventType.SECURITY,
+            severity=AuditEventSeverity.INFO,
+            action="test_action",
+            status="success"
+        )
+    handler.log_event.assert_not_called()
+    
+    logger.log_event(
+        event_type=AuditEventType.SECURITY,
+        severity=AuditEventSeverity.INFO,
+        action="test_action",
+        status="success"
+    )
+    assert handler.log_event.call_count == logger.BATCH_SIZE
+
+def test_drainer_flushes_handlers(tmp_path, monkeypatch):
+    """Test that the background drainer writes events without further logging."""
+    monkeypatch.setattr(SecurityConfig, "SECURE_PATHS", {"logs": str(tmp_path)})
+    log_file = tmp_path / "audit.log"
+    logger = AuditLogger()
+    logger.FLUSH_INTERVAL = 0.01
+    handler = FileAuditLogHandler(str(log_file))
+    handler.FLUSH_INTERVAL = 60  # Only the drainer's flush may write
+    logger.add_handler(handler)
+    
+    try:
+        for _ in range(3):
+            logger.log_event(
+                event_type=AuditEventType.SECURITY,
+                severity=AuditEventSeverity.INFO,
+                action="test_action",
+                status="success"
+            )
+        deadline = time.monotonic() + 5
+        while len(log_file.read_text().splitlines()) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(log_file.read_text().splitlines()) == 3
+    finally:
+        logger.close()
+    assert not logger._drainer.is_alive()
+
+def test_close_drains_before_closing_handlers(tmp_path, monkeypatch):
+    """Test that closing the logger writes queued events before closing files."""
+    monkeypatch.setattr(SecurityConfig, "SECURE_PATHS", {"logs": str(tmp_path)})
+    log_file = tmp_path / "audit.log"
+    logger = AuditLogger()
+    logger.FLUSH_INTERVAL = 60
+    logger.add_handler(FileAuditLogHandler(str(log_file)))
+    
+    logger.log_event(
+        event_type=AuditEventType.SECURITY,
+        severity=AuditEventSeverity.INFO,
+        action="test_action",
+        status="success"
+    )
+    logger.close()
+    
+    assert json.loads(log_file.read_text())["action"] == "test_action"
+    assert not logger._drainer.is_alive()
+
+def test_log_after_close_dispatches_immediately():
+    """Test that events logged after close are not left in the queue."""
+    logger = AuditLogger()
+    handler = Mock(spec=AuditLogHandler, accepts_raw=False)
+    logger.add_handler(handler)
+    logger.close()
+    
+    logger.log_event(
+        event_type=AuditEventType.SECURITY,
+        severity=AuditEventSeverity.INFO,
+        action="test_action",
+        status="success"
+    )
+    handler.log_event.assert_called_once()
+
 def test_convenience_functions(audit_logger, temp_log_file):
     """Test convenience logging functions."""
     # Test security event logging
@@ -148,6 +338,7 @@ def test_error_handling(audit_logger, temp_log_file):
             action="test_action",
             status="success"
         )
+        audit_logger.flush()
     finally:
         # Restore permissions for cleanup
         os.chmod(temp_log_file, 0o666)
@@ -1,7 +1,7 @@
 """Tests for container security functionality."""
 
 import pytest
-from unittest.mock import patch, Mock
+from unittest.mock import AsyncMock, patch, Mock
 from src.domain.security.container import (
     SecurityLevel,
     ContainerStatus,
@@ -12,21 +12,54 @@ from src.domain.security.container import (
 )
 from src.domain.security.policy import Permission, ResourceType
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def container_security_instance():
-    """Create a container security instance."""
+    """Create a container security instance shared by the module."""
     return ContainerSecurity()
 
+@pytest.fixture(autouse=True)
+def reset_container_security(container_security_instance):
+    """Clear policies and scan results between tests."""
+    yield
+    container_security_instance._policies.clear()
+    container_security_instance._scan_results.clear()
+
+@pytest.fixture(scope="module", autouse=True)
+def permission_check():
+    """Patch the global permission check once for the module."""
+    with patch('src.domain.security.policy.policy_enforcer.check_permission') as mock_check:
+        mock_check.return_value = True
+        yield mock_check
+
+@pytest.fixture
+def allow_permission(permission_check):
+    """Set whether permission checks succeed for a single test."""
+    def allow(allowed: bool) -> None:
+        permission_check.return_value = allowed
+    yield allow
+    permission_check.return_value = True
+
+@pytest.fixture
+def stub_scan(container_security_instance):
+    """Return a canned scan result from the security scan for a single test."""
+    def stub(scan_result: SecurityScan) -> None:
+        container_security_instance._perform_security_scan = AsyncMock(return_value=scan_result)
+    yield stub
+    # Drop the instance attribute so the class method is visible again
+    vars(container_security_instance).pop('_perform_security_scan', None)
+
+_BASIC_POLICY = ContainerPolicy(
+    allowed_registries=frozenset({"gcr.io/hexproperty"}),
+    required_labels=frozenset({"maintainer", "version"}),
+    blocked_packages=frozenset({"vulnerable-pkg"}),
+    min_security_score=0.8,
+    security_level=SecurityLevel.HIGH
+)
+
 @pytest.fixture
 def basic_policy():
-    """Create a basic container policy."""
-    return ContainerPolicy(
-        allowed_registries={"gcr.io/hexproperty"},
-        required_labels={"maintainer", "version"},
-        blocked_packages={"vulnerable-pkg"},
-        min_security_score=0.8,
-        security_level=SecurityLevel.HIGH
-    )
+    """Provide the shared basic container policy."""
+    return _BASIC_POLICY
 
 class TestContainerSecurity:
     """Test suite for container security functionality."""
@@ -36,32 +69,26 @@ class TestContainerSecurity:
         """Test container scanning."""
         image_name = "gcr.io/hexproperty/test-app:latest"
         
-        with patch('src.domain.security.policy.policy_enforcer.check_permission', return_value=True):
-            scan_result = await container_security_instance.scan_container(image_name)
+        scan_result = await container_security_instance.scan_container(image_name)
             
-            assert isinstance(scan_result, SecurityScan)
-            assert hasattr(scan_result, 'vulnerabilities')
-            assert hasattr(scan_result, 'security_score')
+        assert isinstance(scan_result, SecurityScan)
+        assert hasattr(scan_result, 'vulnerabilities')
+        assert hasattr(scan_result, 'security_score')
 
     @pytest.mark.asyncio
-    async def test_container_validation(self, container_security_instance, basic_policy):
+    async def test_container_validation(self, container_security_instance, basic_policy, stub_scan):
         """Test container validation against policy."""
         image_name = "gcr.io/hexproperty/test-app:latest"
         policy_name = "test-policy"
         
         container_security_instance.add_policy(policy_name, basic_policy)
         
-        with patch('src.domain.security.policy.policy_enforcer.check_permission', return_value=True):
-            with patch.object(
-                container_security_instance,
-                '_perform_security_scan',
-                return_value=SecurityScan(security_score=0.9)
-            ):
-                status = await container_security_instance.validate_container(
-                    image_name,
-                    policy_name
-                )
-                assert status == ContainerStatus.APPROVED
+        stub_scan(SecurityScan(security_score=0.9))
+        status = await container_security_instance.validate_container(
+            image_name,
+            policy_name
+        )
+        assert status == ContainerStatus.APPROVED
 
     def test_policy_management(self, container_security_instance, basic_policy):
         """Test policy addition and removal."""
@@ -76,14 +103,14 @@ class TestContainerSecurity:
         assert policy_name not in container_security_instance._policies
 
     @pytest.mark.asyncio
-    async def test_permission_checking(self, container_security_instance):
+    async def test_permission_checking(self, container_security_instance, allow_permission):
         """Test permission checking for container operations."""
         image_name = "gcr.io/hexproperty/test-app:latest"
         
         # Test with no permission
-        with patch('src.domain.security.policy.policy_enforcer.check_permission', return_value=False):
-            with pytest.raises(PermissionError):
-                await container_security_instance.scan_container(image_name)
+        allow_permission(False)
+        with pytest.raises(PermissionError):
+            await container_security_instance.scan_container(image_name)
 
     @pytest.mark.asyncio
     async def test_security_levels(self, container_security_instance):
@@ -94,12 +121,14 @@ class TestContainerSecurity:
             "low": ContainerPolicy(security_level=SecurityLevel.LOW)
         }
         
-        for name, policy in policies.items():
-            container_security_instance.add_policy(name, policy)
-            assert container_security_instance._policies[name].security_level == policy.security_level
+        container_security_instance.add_policies(policies)
+        assert all(
+            container_security_instance._policies[name].security_level == policy.security_level
+            for name, policy in policies.items()
+        )
 
     @pytest.mark.asyncio
-    async def test_vulnerability_handling(self, container_security_instance, basic_policy):
+    async def test_vulnerability_handling(self, container_security_instance, basic_policy, stub_scan):
         """Test handling of vulnerabilities."""
         image_name = "gcr.io/hexproperty/test-app:latest"
         policy_name = "test-policy"
@@ -112,36 +141,29 @@ class TestContainerSecurity:
             security_score=0.9
         )
         
-        with patch('src.domain.security.policy.policy_enforcer.check_permission', return_value=True):
-            with patch.object(
-                container_security_instance,
-                '_perform_security_scan',
-                return_value=scan_result
-            ):
-                status = await container_security_instance.validate_container(
-                    image_name,
-                    policy_name
-                )
-                assert status == ContainerStatus.VULNERABLE
-
-    @patch('src.domain.security.audit_log.audit_logger.log_event')
+        stub_scan(scan_result)
+        status = await container_security_instance.validate_container(
+            image_name,
+            policy_name
+        )
+        assert status == ContainerStatus.VULNERABLE
+
     @pytest.mark.asyncio
-    async def test_audit_logging(self, mock_log_event, container_security_instance):
+    async def test_audit_logging(self, container_security_instance, audit_events):
         """Test audit logging of container security events."""
         image_name = "gcr.io/hexproperty/test-app:latest"
         
-        with patch('src.domain.security.policy.policy_enforcer.check_permission', return_value=True):
-            await container_security_instance.scan_container(image_name)
+        await container_security_instance.scan_container(image_name)
             
-            # Verify scan audit log
-            mock_log_event.assert_called_with(
-                event_type="SECURITY",
-                severity="INFO",
-                action="container_scan",
-                status="completed",
-                details={
-                    "image": image_name,
-                    "score": 0.0,
-                    "vulnerabilities": 0
-                }
-            )
+        # Verify scan audit log
+        assert audit_events[-1] == dict(
+            event_type="SECURITY",
+            severity="INFO",
+            action="container_scan",
+            status="completed",
+            details={
+                "image": image_name,
+                "score": 0.0,
+                "vulnerabilities": 0
+            }
+        )
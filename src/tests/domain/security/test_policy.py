@@ -1,35 +1,45 @@
 """Tests for security policy functionality."""
 
+import time
+
 import pytest
-from unittest.mock import patch
 from src.domain.security.policy import (
     Permission,
     ResourceType,
     PolicyRule,
     SecurityPolicy,
     PolicyEnforcer,
-    require_permission
+    require_permission,
+    _compile
 )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def policy_enforcer():
-    """Create a policy enforcer instance."""
+    """Create a policy enforcer instance shared by the module."""
     return PolicyEnforcer()
 
+@pytest.fixture(autouse=True)
+def reset_policy_enforcer(policy_enforcer):
+    """Clear registered policies between tests."""
+    yield
+    policy_enforcer._policies.clear()
+
+_BASIC_POLICY = SecurityPolicy(
+    name="test-policy",
+    rules=[
+        PolicyRule(
+            permissions=frozenset({Permission.READ, Permission.WRITE}),
+            resource_types=frozenset({ResourceType.DEPLOYMENT}),
+            resource_patterns=("test-.*",)
+        )
+    ],
+    priority=1
+)
+
 @pytest.fixture
 def basic_policy():
-    """Create a basic security policy."""
-    return SecurityPolicy(
-        name="test-policy",
-        rules=[
-            PolicyRule(
-                permissions={Permission.READ, Permission.WRITE},
-                resource_types={ResourceType.DEPLOYMENT},
-                resource_patterns=["test-.*"]
-            )
-        ],
-        priority=1
-    )
+    """Provide the shared basic security policy."""
+    return _BASIC_POLICY
 
 class TestSecurityPolicy:
     """Test suite for security policy functionality."""
@@ -151,8 +161,7 @@ class TestSecurityPolicy:
             context={"environment": "dev", "role": "admin"}
         )
 
-    @patch('src.domain.security.audit_log.audit_logger.log_event')
-    def test_audit_logging(self, mock_log_event, policy_enforcer, basic_policy):
+    def test_audit_logging(self, policy_enforcer, basic_policy, audit_events):
         """Test audit logging of policy decisions."""
         policy_enforcer.add_policy(basic_policy)
         
@@ -164,7 +173,7 @@ class TestSecurityPolicy:
         )
         
         # Verify audit log for allowed permission
-        mock_log_event.assert_called_with(
+        assert audit_events[-1] == dict(
             event_type="SECURITY",
             severity="INFO",
             action="permission_check",
@@ -185,7 +194,7 @@ class TestSecurityPolicy:
         )
         
         # Verify audit log for denied permission
-        mock_log_event.assert_called_with(
+        assert audit_events[-1] == dict(
             event_type="SECURITY",
             severity="WARNING",
             action="permission_check",
@@ -233,3 +242,47 @@ class TestSecurityPolicy:
             ResourceType.DEPLOYMENT,
             "test-deployment"
         )
+
+    def test_pattern_compilation_cached(self, policy_enforcer, basic_policy):
+        """Test that policy patterns are compiled once and reused."""
+        policy_enforcer.add_policy(basic_policy)
+        _compile.cache_clear()
+        
+        for _ in range(3):
+            assert policy_enforcer.check_permission(
+                Permission.READ,
+                ResourceType.DEPLOYMENT,
+                "test-deployment"
+            )
+        
+        cache_info = _compile.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 2
+
+    def test_backtracking_pattern_warning(self, caplog):
+        """Test that nested quantifiers in patterns are reported."""
+        _compile.cache_clear()
+        _compile(r"(a+)+\1$")
+        assert "nested quantifiers" in caplog.text
+
+    def test_redos_resilience(self, policy_enforcer):
+        """Test that a ReDoS-prone pattern is evaluated in linear time."""
+        pytest.importorskip("re2")
+        policy_enforcer.add_policy(SecurityPolicy(
+            name="redos-test",
+            rules=[
+                PolicyRule(
+                    permissions={Permission.READ},
+                    resource_types={ResourceType.DEPLOYMENT},
+                    resource_patterns=[r"(a+)+$"]
+                )
+            ]
+        ))
+        
+        start = time.perf_counter()
+        assert not policy_enforcer.check_permission(
+            Permission.READ,
+            ResourceType.DEPLOYMENT,
+            "a" * 10000 + "!"
+        )
+        assert time.perf_counter() - start < 0.1
@@ -16,34 +16,47 @@ from src.domain.security.audit_log import (
     audit_logger
 )
 
-@pytest.fixture
-def rate_limit_config():
-    """Basic rate limit configuration."""
-    return RateLimitConfig(
-        max_requests=10,
-        time_window=60,
-        burst_limit=15
-    )
+_RATE_LIMIT_CONFIG = RateLimitConfig(
+    max_requests=10,
+    time_window=60,
+    burst_limit=15
+)
 
-@pytest.fixture
-def group_rate_limit_config():
-    """Rate limit configuration with group settings."""
-    return RateLimitConfig(
-        max_requests=10,
-        time_window=60,
-        burst_limit=15,
-        group_key="tenant_id"
-    )
+_GROUP_RATE_LIMIT_CONFIG = RateLimitConfig(
+    max_requests=10,
+    time_window=60,
+    burst_limit=15,
+    group_key="tenant_id"
+)
 
 @pytest.fixture
-def limiter(rate_limit_config):
-    """Rate limiter instance."""
-    return RateLimiter(rate_limit_config)
+def fake_clock():
+    """Controllable clock for the rate limiter; advance it by adding to [0]."""
+    now = [time.monotonic()]
+    with patch('src.domain.security.rate_limiter.time') as mock_time:
+        mock_time.monotonic.side_effect = lambda: now[0]
+        yield now
 
-@pytest.fixture
-def group_limiter(group_rate_limit_config):
-    """Rate limiter instance with group configuration."""
-    return RateLimiter(group_rate_limit_config)
+@pytest.fixture(scope="module")
+def limiter():
+    """Rate limiter instance shared by the module."""
+    return RateLimiter(_RATE_LIMIT_CONFIG)
+
+@pytest.fixture(scope="module")
+def group_limiter():
+    """Rate limiter instance with group configuration shared by the module."""
+    return RateLimiter(_GROUP_RATE_LIMIT_CONFIG)
+
+@pytest.fixture(autouse=True)
+def reset_limiters(limiter, group_limiter):
+    """Clear tracked request windows between tests."""
+    yield
+    limiter._windows.clear()
+    group_limiter._windows.clear()
+
+def _fill(limiter, key, n):
+    """Record n requests for key at the current time without checking limits."""
+    limiter._get_or_create_window(key).requests.extend([time.monotonic()] * n)
 
 class TestRateLimiter:
     """Test suite for rate limiter functionality."""
@@ -88,7 +101,7 @@ class TestRateLimiter:
             limiter.check_rate_limit(key)
         assert exc.value.remaining_time > 0
 
-    def test_window_sliding(self, limiter):
+    def test_window_sliding(self, limiter, fake_clock):
         """Test sliding window behavior."""
         key = "test_user"
         
@@ -96,8 +109,8 @@ class TestRateLimiter:
         for _ in range(10):
             assert limiter.check_rate_limit(key) is True
         
-        # Wait for half the window
-        time.sleep(30)
+        # Advance half the window
+        fake_clock[0] += 30
         
         # Should allow more requests
         assert limiter.check_rate_limit(key) is True
@@ -137,40 +150,56 @@ class TestRateLimiter:
         assert limiter.get_remaining(key) == 15
         
         # After some requests
-        for _ in range(5):
-            limiter.check_rate_limit(key)
+        _fill(limiter, key, 5)
         assert limiter.get_remaining(key) == 10
 
-    def test_cleanup(self, limiter):
+    def test_cleanup(self, limiter, fake_clock):
         """Test cleanup of expired windows."""
         key = "test_user"
         
         # Add some requests
-        for _ in range(5):
-            limiter.check_rate_limit(key)
+        _fill(limiter, key, 5)
         
-        # Wait for window to expire
-        time.sleep(61)
+        # Advance past the window
+        fake_clock[0] += 61
         
         # Cleanup should remove expired window
         limiter.cleanup()
         assert limiter.get_remaining(key) == 15
 
-    @patch('src.domain.security.audit_log.audit_logger.log_event')
-    def test_audit_logging(self, mock_log_event, limiter):
+    def test_cleanup_large(self, limiter, fake_clock):
+        """Test that expiring very large windows does not scan every entry."""
+        comparisons = [0]
+        
+        class Stamp(float):
+            # bisect's "cutoff < entry" dispatches here, counting each probe
+            def __gt__(self, other):
+                comparisons[0] += 1
+                return float.__gt__(self, other)
+        
+        stale = [Stamp(fake_clock[0] - 3600)] * 1_000_000
+        limiter._get_or_create_window("stale").requests = stale
+        limiter._get_or_create_window("mixed").requests = stale + [fake_clock[0]]
+        
+        limiter.cleanup()
+        assert "stale" not in limiter._windows
+        assert limiter.get_remaining("mixed") == 14
+        assert limiter._windows["mixed"].requests == [fake_clock[0]]
+        assert comparisons[0] < 100
+
+    def test_audit_logging(self, limiter, audit_events):
         """Test audit logging of rate limit events."""
         key = "test_user"
         
         # Fill up the limit
-        for _ in range(15):
-            limiter.check_rate_limit(key)
+        _fill(limiter, key, 15)
         
         # Trigger rate limit exceeded
         with pytest.raises(RateLimitExceeded):
             limiter.check_rate_limit(key)
         
         # Verify audit log
-        mock_log_event.assert_called_with(
+        assert audit_events == [dict(
             event_type=AuditEventType.SECURITY,
             severity=AuditEventSeverity.WARNING,
             action="rate_limit_exceeded",
@@ -180,7 +209,7 @@ class TestRateLimiter:
                 "limit": 15,
                 "window": 60
             }
-        )
+        )]
 
     def test_decorator(self, limiter):
         """Test rate limit decorator."""
@@ -209,3 +238,20 @@ class TestRateLimiter:
         for _ in range(15):
             assert test_func(user_id='user1') is True
         assert test_func(user_id='user2') is True
+
+    def test_bench_rate_limiter(self, benchmark, request):
+        """Benchmark 10k rate limit checks on a single key.
+
+        Only runs under ``--benchmark-only``; compare runs with
+        ``pytest-benchmark compare``.
+        """
+        if not request.config.getoption("benchmark_only"):
+            pytest.skip("benchmarks run with --benchmark-only")
+        bench_limiter = RateLimiter(RateLimitConfig(max_requests=10_000, time_window=60))
+        
+        def run():
+            bench_limiter._windows.clear()
+            for _ in range(10_000):
+                bench_limiter.check_rate_limit("k")
+        
+        benchmark(run)
@@ -1,100 +1,115 @@
 """Tests for security middleware functionality."""
 
+import httpx
 import pytest
-from fastapi import FastAPI, Request, Response
-from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch
+from fastapi import APIRouter, FastAPI, Request, Response
 from src.domain.security.middleware import SecurityMiddleware
 from src.domain.security.rate_limiter import RateLimitExceeded
 
-@pytest.fixture
+async def _test_endpoint():
+    return {"message": "test"}
+
+async def _error_endpoint():
+    raise ValueError("Test error")
+
+# Every endpoint used by the tests, built once at import time
+_TEST_ROUTER = APIRouter()
+for _path in (
+    "/test-headers",
+    "/test/../sensitive",
+    "/test-xss",
+    "/limited",
+    "/test-logging",
+    "/test-cors",
+    "/group-limited",
+):
+    _TEST_ROUTER.add_api_route(_path, _test_endpoint, methods=["GET"])
+_TEST_ROUTER.add_api_route("/test-error", _error_endpoint, methods=["GET"])
+
+@pytest.fixture(scope="class")
 def app():
-    """Create test FastAPI application."""
+    """Create test FastAPI application shared by the test class."""
     return FastAPI()
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def security_middleware(app):
-    """Create security middleware instance."""
-    return SecurityMiddleware(app)
+    """Create security middleware instance and install it on the app."""
+    middleware = SecurityMiddleware(app)
+    app.middleware("http")(middleware.__call__)
+    return middleware
 
 @pytest.fixture
-def client(app, security_middleware):
-    """Create test client with security middleware."""
-    app.middleware("http")(security_middleware.__call__)
-    return TestClient(app)
+async def client(app, security_middleware):
+    """Create an async test client that calls the app in-process."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+
+@pytest.fixture(scope="class", autouse=True)
+def routes(app):
+    """Mount the test endpoints once per class."""
+    app.include_router(_TEST_ROUTER)
 
 class TestSecurityMiddleware:
     """Test suite for security middleware."""
 
-    def test_security_headers(self, client):
+    @pytest.mark.parametrize("header,expected,exact", [
+        ("X-Frame-Options", "DENY", True),
+        ("X-XSS-Protection", "1; mode=block", True),
+        ("X-Content-Type-Options", "nosniff", True),
+        ("Strict-Transport-Security", "max-age=31536000", False),
+        ("Content-Security-Policy", "default-src 'self'", False),
+        ("Referrer-Policy", "strict-origin-when-cross-origin", True),
+        ("Permissions-Policy", "geolocation=()", False),
+    ])
+    @pytest.mark.asyncio
+    async def test_security_headers(self, client, header, expected, exact):
         """Test security headers are properly set."""
-        @client.app.get("/test-headers")
-        async def test_endpoint():
-            return {"message": "test"}
-
-        response = client.get("/test-headers")
+        response = await client.get("/test-headers")
         assert response.status_code == 200
         
-        # Verify security headers
-        headers = response.headers
-        assert headers["X-Frame-Options"] == "DENY"
-        assert headers["X-XSS-Protection"] == "1; mode=block"
-        assert headers["X-Content-Type-Options"] == "nosniff"
-        assert "max-age=31536000" in headers["Strict-Transport-Security"]
-        assert "default-src 'self'" in headers["Content-Security-Policy"]
-        assert headers["Referrer-Policy"] == "strict-origin-when-cross-origin"
-        assert "geolocation=()" in headers["Permissions-Policy"]
-
-    def test_path_traversal_prevention(self, client):
-        """Test path traversal prevention."""
-        @client.app.get("/test/../sensitive")
-        async def test_endpoint():
-            return {"message": "test"}
+        # Verify security header; multi-directive headers only need to contain it
+        if exact:
+            assert response.headers[header] == expected
+        else:
+            assert expected in response.headers[header]
 
-        response = client.get("/test/../sensitive")
+    @pytest.mark.asyncio
+    async def test_path_traversal_prevention(self, client):
+        """Test path traversal prevention."""
+        response = await client.get("/test/../sensitive")
         assert response.status_code == 400
         assert response.json() == "Invalid path"
 
-    def test_xss_prevention(self, client):
+    @pytest.mark.asyncio
+    async def test_xss_prevention(self, client):
         """Test XSS prevention in headers."""
-        @client.app.get("/test-xss")
-        async def test_endpoint():
-            return {"message": "test"}
-
         headers = {
             "X-Custom": "<script>alert('xss')</script>"
         }
-        response = client.get("/test-xss", headers=headers)
+        response = await client.get("/test-xss", headers=headers)
         assert response.status_code == 400
         assert response.json() == "Invalid headers"
 
     @pytest.mark.asyncio
     async def test_rate_limiting(self, app, client, security_middleware):
         """Test rate limiting functionality."""
-        @app.get("/limited")
-        async def limited_endpoint():
-            return {"message": "test"}
-
         # Test within limit
         for _ in range(10):
-            response = client.get("/limited")
+            response = await client.get("/limited")
             assert response.status_code == 200
 
         # Test exceeding limit
-        response = client.get("/limited")
+        response = await client.get("/limited")
         assert response.status_code == 429
         assert "Rate limit exceeded" in response.json()
 
-    @patch('src.domain.security.audit_log.audit_logger.log_event')
-    def test_security_event_logging(self, mock_log_event, client):
+    @pytest.mark.asyncio
+    async def test_security_event_logging(self, client, audit_events):
         """Test security event logging."""
-        @client.app.get("/test-logging")
-        async def test_endpoint():
-            return {"message": "test"}
-
         # Test path traversal attempt
-        client.get("/test-logging/../sensitive")
-        mock_log_event.assert_called_with(
+        await client.get("/test-logging/../sensitive")
+        assert audit_events[-1] == dict(
             event_type="SECURITY",
             severity="WARNING",
             action="path_traversal_attempt",
@@ -104,8 +119,8 @@ class TestSecurityMiddleware:
 
         # Test XSS attempt
         headers = {"X-Custom": "<script>alert('xss')</script>"}
-        client.get("/test-logging", headers=headers)
-        mock_log_event.assert_called_with(
+        await client.get("/test-logging", headers=headers)
+        assert audit_events[-1] == dict(
             event_type="SECURITY",
             severity="WARNING",
             action="xss_attempt",
@@ -113,44 +128,34 @@ class TestSecurityMiddleware:
             details={"headers": headers}
         )
 
-    def test_cors_configuration(self, client):
+    @pytest.mark.asyncio
+    async def test_cors_configuration(self, client):
         """Test CORS configuration."""
-        @client.app.get("/test-cors")
-        async def test_endpoint():
-            return {"message": "test"}
-
         headers = {
             "Origin": "https://hexproperty.com"
         }
-        response = client.options("/test-cors", headers=headers)
+        response = await client.options("/test-cors", headers=headers)
         assert response.status_code == 200
         assert response.headers["Access-Control-Allow-Origin"] == "https://hexproperty.com"
         assert response.headers["Access-Control-Allow-Credentials"] == "true"
 
-    def test_error_handling(self, client):
+    @pytest.mark.asyncio
+    async def test_error_handling(self, client):
         """Test error handling in middleware."""
-        @client.app.get("/test-error")
-        async def test_endpoint():
-            raise ValueError("Test error")
-
-        response = client.get("/test-error")
+        response = await client.get("/test-error")
         assert response.status_code == 500
         assert response.json() == "Internal server error"
 
     @pytest.mark.asyncio
     async def test_group_rate_limiting(self, app, client, security_middleware):
         """Test group-based rate limiting."""
-        @app.get("/group-limited")
-        async def group_limited_endpoint():
-            return {"message": "test"}
-
         # Test within group limit
         headers = {"X-Tenant-ID": "tenant1"}
         for _ in range(10):
-            response = client.get("/group-limited", headers=headers)
+            response = await client.get("/group-limited", headers=headers)
             assert response.status_code == 200
 
         # Test exceeding group limit
-        response = client.get("/group-limited", headers=headers)
+        response = await client.get("/group-limited", headers=headers)
         assert response.status_code == 429
         assert "Group rate limit exceeded" in response.json()
@@ -1,20 +1,20 @@
 import pytest
-import json
 from pathlib import Path
 from datetime import datetime
 from unittest.mock import Mock, patch
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from domain.models.deployment_model import DeploymentRecord
 from services.deployment_history_service import DeploymentHistoryService
+from utils import fastjson
 
 @pytest.fixture
-def history_dir(tmp_path):
-    """Creates a temporary directory for deployment history tests"""
-    return tmp_path / "deployments"
+def history_dir(request):
+    """Creates a temporary directory for deployment history tests
+
+    Parametrize indirectly with "fast_fs" to use an in-memory filesystem.
+    """
+    root = request.getfixturevalue(getattr(request, "param", "tmp_path"))
+    return root / "deployments"
 
 @pytest.fixture
 def deployment_service(history_dir):
@@ -55,10 +55,7 @@ async def test_analyze_deployment_history(deployment_service, history_dir):
         }
     ]
     
-    for dep in deployments:
-        path = history_dir / f"{dep['id']}.json"
-        with open(path, 'w') as f:
-            json.dump(dep, f)
+    await deployment_service.import_records(deployments)
             
     analysis = await deployment_service.analyze_deployment_history()
     
@@ -70,13 +67,12 @@ async def test_analyze_deployment_history(deployment_service, history_dir):
 @pytest.mark.asyncio
 async def test_record_deployment(deployment_service, sample_deployment):
     """Tests deployment recording functionality"""
-    deployment_path = await deployment_service.record_deployment(sample_deployment)
+    deployment_id = await deployment_service.record_deployment(sample_deployment)
+    
+    assert deployment_id == sample_deployment.deployment_id
     
-    assert Path(deployment_path).exists()
+    deployment_data = await deployment_service.get_deployment(deployment_id)
     
-    with open(deployment_path, 'r') as f:
-        deployment_data = json.load(f)
-        
     assert deployment_data["id"] == sample_deployment.deployment_id
     assert deployment_data["type"] == sample_deployment.deployment_type
     assert deployment_data["status"] == sample_deployment.status
@@ -86,7 +82,7 @@ async def test_record_deployment(deployment_service, sample_deployment):
 async def test_update_deployment_status(deployment_service, sample_deployment):
     """Tests deployment status update functionality"""
     # First record the deployment
-    deployment_path = await deployment_service.record_deployment(sample_deployment)
+    await deployment_service.record_deployment(sample_deployment)
     
     # Then update its status
     result = await deployment_service.update_deployment_status(
@@ -97,11 +93,10 @@ async def test_update_deployment_status(deployment_service, sample_deployment):
     
     assert result is True
     
-    with open(deployment_path, 'r') as f:
-        deployment_data = json.load(f)
-        assert deployment_data["status"] == "completed"
-        assert "last_modified" in deployment_data
-        assert deployment_data["modified_by"] == "test_user"
+    deployment_data = await deployment_service.get_deployment(sample_deployment.deployment_id)
+    assert deployment_data["status"] == "completed"
+    assert "last_modified" in deployment_data
+    assert deployment_data["modified_by"] == "test_user"
 
 @pytest.mark.asyncio
 async def test_generate_deployment_metrics(deployment_service, history_dir):
@@ -124,10 +119,7 @@ async def test_generate_deployment_metrics(deployment_service, history_dir):
         }
     ]
     
-    for dep in deployments:
-        path = history_dir / f"{dep['id']}.json"
-        with open(path, 'w') as f:
-            json.dump(dep, f)
+    await deployment_service.import_records(deployments)
             
     metrics = await deployment_service.generate_deployment_metrics()
     
@@ -141,15 +133,10 @@ async def test_generate_deployment_metrics(deployment_service, history_dir):
 async def test_optimize_deployment_records(deployment_service, history_dir):
     """Tests deployment record optimization functionality"""
     # Create test deployment records
-    for i in range(5):
-        deployment = {
-            "id": f"deploy{i}",
-            "type": "test",
-            "status": "completed"
-        }
-        path = history_dir / f"deploy{i}.json"
-        with open(path, 'w') as f:
-            json.dump(deployment, f)
+    await deployment_service.import_records(
+        {"id": f"deploy{i}", "type": "test", "status": "completed"}
+        for i in range(5)
+    )
             
     optimization_results = await deployment_service.optimize_deployment_records()
     
@@ -159,6 +146,88 @@ async def test_optimize_deployment_records(deployment_service, history_dir):
     assert isinstance(optimization_results["indexed"], dict)
 
 @pytest.mark.asyncio
+async def test_log_compaction(deployment_service, history_dir):
+    """Tests that superseded record versions are compacted away"""
+    await deployment_service.import_records([
+        {"id": "deploy1", "type": "test", "status": "pending"},
+        {"id": "deploy2", "type": "test", "status": "completed"},
+        {"id": "deploy1", "type": "test", "status": "completed"}
+    ])
+    
+    optimization_results = await deployment_service.optimize_deployment_records()
+    
+    assert optimization_results["compressed"]["compressed_count"] == 1
+    assert optimization_results["compressed"]["total_size_saved"] > 0
+    assert set(optimization_results["indexed"]) == {"deploy1", "deploy2"}
+    assert (await deployment_service.get_deployment("deploy1"))["status"] == "completed"
+    
+    exported = await deployment_service.export_json(str(history_dir / "export"))
+    assert sorted(Path(path).name for path in exported) == ["deploy1.json", "deploy2.json"]
+    assert fastjson.loads(Path(exported[0]).read_bytes())["status"] == "completed"
+
+@pytest.mark.asyncio
+async def test_legacy_json_records_imported(history_dir):
+    """Tests that <id>.json files from before the log are imported on first start"""
+    legacy = [
+        {"id": "deploy1", "type": "test", "status": "completed"},
+        {"id": "deploy2", "type": "test", "status": "failed"}
+    ]
+    history_dir.mkdir()
+    for record in legacy:
+        (history_dir / f"{record['id']}.json").write_bytes(fastjson.dumps(record))
+    (history_dir / "broken.json").write_text("{not json")
+    
+    service = DeploymentHistoryService(str(history_dir))
+    assert (await service.analyze_deployment_history())["total_deployments"] == 2
+    assert await service.update_deployment_status("deploy2", "completed", "test_user") is True
+    
+    # The log now exists, so a restart doesn't import the JSON files again
+    restarted = DeploymentHistoryService(str(history_dir))
+    assert (await restarted.get_deployment("deploy2"))["status"] == "completed"
+    assert (await restarted.analyze_deployment_history())["total_deployments"] == 2
+
+@pytest.mark.asyncio
+async def test_import_rejects_record_without_id(deployment_service, history_dir):
+    """Tests that a record without an id never reaches the log"""
+    with pytest.raises(ValueError):
+        await deployment_service.import_records([{"type": "test"}])
+    
+    await deployment_service.import_records([{"id": "deploy1", "type": "test"}])
+    reopened = DeploymentHistoryService(str(history_dir))
+    assert (await reopened.get_deployment("deploy1"))["type"] == "test"
+
+@pytest.mark.asyncio
+async def test_corrupt_log_tail(deployment_service, history_dir):
+    """Tests that a corrupt log tail is skipped instead of breaking the service"""
+    await deployment_service.import_records([
+        {"id": "deploy1", "type": "test", "status": "completed"}
+    ])
+    with open(deployment_service.log_path, "ab") as f:
+        f.write(b"\xc1")  # Never valid MessagePack
+    
+    reopened = DeploymentHistoryService(str(history_dir))
+    assert (await reopened.get_deployment("deploy1"))["status"] == "completed"
+    assert (await reopened.analyze_deployment_history())["total_deployments"] == 1
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("damage", [b"\xc1", b"\x82\xa2id"], ids=["corrupt", "incomplete"])
+async def test_append_after_damaged_tail(deployment_service, history_dir, damage):
+    """Tests that records appended after a damaged tail survive a restart"""
+    await deployment_service.import_records([{"id": "deploy1", "type": "test", "status": "completed"}])
+    with open(deployment_service.log_path, "ab") as f:
+        f.write(damage)
+    
+    reopened = DeploymentHistoryService(str(history_dir))
+    await reopened.import_records([{"id": "deploy2", "type": "test", "status": "completed"}])
+    
+    restarted = DeploymentHistoryService(str(history_dir))
+    assert (await restarted.get_deployment("deploy2"))["type"] == "test"
+    assert (await restarted.analyze_deployment_history())["total_deployments"] == 2
+    damaged = list(history_dir.glob(f"{DeploymentHistoryService.LOG_FILE}.damaged-*"))
+    assert [path.read_bytes() for path in damaged] == [damage]
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("history_dir", ["fast_fs"], indirect=True)
 async def test_deployment_not_found(deployment_service):
     """Tests error handling for non-existent deployments"""
     result = await deployment_service.update_deployment_status(
@@ -172,8 +241,8 @@ async def test_deployment_not_found(deployment_service):
 async def test_deployment_validation(deployment_service, sample_deployment):
     """Tests deployment validation functionality"""
     # Test with valid deployment
-    deployment_path = await deployment_service.record_deployment(sample_deployment)
-    assert Path(deployment_path).exists()
+    deployment_id = await deployment_service.record_deployment(sample_deployment)
+    assert await deployment_service.get_deployment(deployment_id) is not None
     
     # Test with invalid deployment (missing required fields)
     invalid_deployment = DeploymentRecord(
@@ -194,7 +263,6 @@ async def test_deployment_error_handling(deployment_service, sample_deployment):
     sample_deployment.add_error("test_error", "Test error message")
     await deployment_service.record_deployment(sample_deployment)
     
-    with open(deployment_path, 'r') as f:
-        deployment_data = json.load(f)
-        assert len(deployment_data["errors"]) > 0
-        assert deployment_data["errors"][0]["type"] == "test_error"
+    deployment_data = await deployment_service.get_deployment(sample_deployment.deployment_id)
+    assert len(deployment_data["errors"]) > 0
+    assert deployment_data["errors"][0]["type"] == "test_error"
@@ -1,15 +1,11 @@
 import pytest
-import json
 from pathlib import Path
 from datetime import datetime
 from unittest.mock import Mock, patch
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from domain.models.config_model import ConfigModel
 from services.template_service import TemplateService
+from utils import fastjson
 
 @pytest.fixture
 def template_dir(tmp_path):
@@ -52,8 +48,7 @@ async def test_analyze_template(template_service, template_dir):
     
     template_path = template_dir / "test.json"
     template_path.parent.mkdir(exist_ok=True)
-    with open(template_path, 'w') as f:
-        json.dump(template_data, f)
+    template_path.write_bytes(fastjson.dumps(template_data))
         
     analysis = await template_service.analyze_template("test")
     
@@ -71,9 +66,8 @@ async def test_create_template(template_service, sample_config):
     
     assert Path(template_path).exists()
     
-    with open(template_path, 'r') as f:
-        template_data = json.load(f)
-        
+    template_data = fastjson.loads(Path(template_path).read_bytes())
+    
     assert template_data["name"] == sample_config.name
     assert template_data["description"] == sample_config.description
     assert "strategies" in template_data
@@ -92,8 +86,7 @@ async def test_validate_template(template_service, template_dir):
     }
     
     valid_path = template_dir / "valid.json"
-    with open(valid_path, 'w') as f:
-        json.dump(valid_template, f)
+    valid_path.write_bytes(fastjson.dumps(valid_template))
         
     assert await template_service.validate_template("valid") is True
     
@@ -104,10 +97,13 @@ async def test_validate_template(template_service, template_dir):
     }
     
     invalid_path = template_dir / "invalid.json"
-    with open(invalid_path, 'w') as f:
-        json.dump(invalid_template, f)
+    invalid_path.write_bytes(fastjson.dumps(invalid_template))
         
     assert await template_service.validate_template("invalid") is False
+    assert await template_service.explain_validation("invalid") == {
+        "TemplateValidator": False,
+        "StrategiesValidator": False
+    }
 
 @pytest.mark.asyncio
 async def test_optimize_template(template_service, template_dir):
@@ -121,8 +117,7 @@ async def test_optimize_template(template_service, template_dir):
     }
     
     template_path = template_dir / "test.json"
-    with open(template_path, 'w') as f:
-        json.dump(template_data, f)
+    template_path.write_bytes(fastjson.dumps(template_data))
         
     optimized = await template_service.optimize_template("test")
     
@@ -150,8 +145,7 @@ async def test_template_metrics(template_service, template_dir):
     }
     
     template_path = template_dir / "test.json"
-    with open(template_path, 'w') as f:
-        json.dump(template_data, f)
+    template_path.write_bytes(fastjson.dumps(template_data))
         
     optimized = await template_service.optimize_template("test")
     metrics = optimized["performance_metrics"]
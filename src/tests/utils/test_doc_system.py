@@ -1,20 +1,39 @@
 """Tests for documentation generation system."""
 
+import os
 import pytest
 from pathlib import Path
 import tempfile
 import shutil
 import yaml
-from src.utils.template_validator import TemplateValidator
-from src.utils.doc_generator import DocumentGenerator
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # libyaml not available, use the pure-Python classes
+    from yaml import SafeLoader, SafeDumper
+from src.utils import template_validator
+from src.utils.template_validator import TemplateValidator, _ValidationDiskCache
+from src.utils.doc_generator import COMPILED_TEMPLATES, DocumentGenerator, compile_templates
 from src.utils.doc_helpers import DocSeriesGenerator
 
 @pytest.fixture
-def temp_dir():
-    """Create temporary directory for tests."""
+def temp_dir(request):
+    """Create temporary directory for tests.
+    
+    Parametrize indirectly with "fast_fs" to use an in-memory filesystem.
+    """
+    if getattr(request, "param", None) == "fast_fs":
+        yield request.getfixturevalue("fast_fs")
+        return
     with tempfile.TemporaryDirectory() as tmp_dir:
         yield Path(tmp_dir)
 
+@pytest.fixture(autouse=True)
+def validation_cache(temp_dir, monkeypatch):
+    """Keep persisted validation results inside the test directory."""
+    cache = _ValidationDiskCache(temp_dir / "template_validation.json")
+    monkeypatch.setattr(template_validator, "_disk_cache", cache)
+    return cache
+
 @pytest.fixture
 def templates_dir(temp_dir):
     """Create test templates directory with config."""
@@ -35,7 +54,7 @@ def templates_dir(temp_dir):
     }
     
     with open(templates / "templates_config.yaml", "w") as f:
-        yaml.dump(config, f)
+        yaml.dump(config, f, Dumper=SafeDumper)
         
     # Create template file
     template_content = """# Overview
@@ -70,6 +89,7 @@ class TestTemplateValidator:
         assert is_valid
         assert len(errors) == 0
         
+    @pytest.mark.parametrize("temp_dir", ["fast_fs"], indirect=True)
     def test_validate_missing_template(self, templates_dir):
         validator = TemplateValidator(str(templates_dir))
         is_valid, errors = validator.validate_template("Missing Template")
@@ -84,18 +104,84 @@ class TestTemplateValidator:
         # Update config
         config_path = templates_dir / "templates_config.yaml"
         with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
         
         config["templates"]["Bad Template"] = {"file": "bad_template.md"}
         
         with open(config_path, "w") as f:
-            yaml.dump(config, f)
+            yaml.dump(config, f, Dumper=SafeDumper)
             
         validator = TemplateValidator(str(templates_dir))
         is_valid, errors = validator.validate_template("Bad Template")
         assert not is_valid
         assert any("Missing required section" in err for err in errors)
 
+    def test_validation_tracks_template_changes(self, templates_dir):
+        validator = TemplateValidator(str(templates_dir))
+        assert validator.validate_template("Test Template")[0]
+        
+        template_file = templates_dir / "test_template.md"
+        stat = template_file.stat()
+        template_file.write_text("Content without required sections")
+        os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        
+        is_valid, errors = validator.validate_template("Test Template")
+        assert not is_valid
+        assert any("Missing required section" in err for err in errors)
+
+    def test_validator_sees_config_edits(self, templates_dir):
+        validator = TemplateValidator(str(templates_dir))
+        assert validator.validate_template("Test Template")[0]
+        
+        config_file = templates_dir / "templates_config.yaml"
+        config = yaml.load(config_file.read_text(), Loader=SafeLoader)
+        config["validation_rules"]["required_sections"].append("## Rollback")
+        stat = config_file.stat()
+        config_file.write_text(yaml.dump(config, Dumper=SafeDumper))
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        
+        is_valid, errors = validator.validate_template("Test Template")
+        assert not is_valid
+        assert errors == ["Missing required section: ## Rollback"]
+
+    def test_validation_results_persist(self, templates_dir, validation_cache, monkeypatch):
+        validator = TemplateValidator(str(templates_dir))
+        expected = validator.validate_template("Test Template")
+        validation_cache.save()
+        
+        # A fresh process reads the saved result instead of rescanning
+        cache = _ValidationDiskCache(validation_cache.path)
+        monkeypatch.setattr(template_validator, "_disk_cache", cache)
+        monkeypatch.setattr(template_validator, "_check_template", None)
+        assert validator.validate_template("Test Template") == expected
+
+    def test_validation_cache_save_failure_is_logged(self, templates_dir, temp_dir, caplog):
+        unwritable = temp_dir / "not_a_dir"
+        unwritable.write_text("")
+        cache = _ValidationDiskCache(unwritable / "template_validation.json")
+        cache.put("key", str(templates_dir / "test_template.md"), True, [])
+        
+        cache.save()
+        assert "Could not save template validation cache" in caplog.text
+
+    def test_validation_cache_keeps_newest_entry(self, templates_dir, validation_cache):
+        validator = TemplateValidator(str(templates_dir))
+        is_valid, errors = validator.validate_template("Test Template")
+        errors.append("caller scribble")
+        assert validator.validate_template("Test Template") == (is_valid, [])
+        
+        template_file = templates_dir / "test_template.md"
+        stat = template_file.stat()
+        template_file.write_text("Content without required sections")
+        os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        validator.validate_template("Test Template")
+        assert len(validation_cache._load()) == 1
+        
+        # Results for deleted templates are not written back
+        template_file.unlink()
+        validation_cache.save()
+        assert _ValidationDiskCache(validation_cache.path)._load() == {}
+
 class TestDocumentGenerator:
     """Test document generation functionality."""
     
@@ -125,6 +211,40 @@ class TestDocumentGenerator:
         assert output_file.read_text() == content
         assert output_file.name == "test_template_iter1.md"
 
+    def test_source_edits_are_rendered(self, templates_dir, output_dir):
+        context = {"title": "Edited", "description": "Reloaded", "iteration_phase": "Initial Draft"}
+        generator = DocumentGenerator(str(templates_dir), str(output_dir))
+        assert "Title: Edited" in generator.generate_document("Test Template", dict(context))
+        
+        template_file = templates_dir / "test_template.md"
+        stat = template_file.stat()
+        template_file.write_text(template_file.read_text().replace("Title:", "Heading:"))
+        os.utime(template_file, (stat.st_atime, stat.st_mtime + 1))
+        
+        content = DocumentGenerator(str(templates_dir), str(output_dir)).generate_document(
+            "Test Template", dict(context)
+        )
+        assert "Heading: Edited" in content
+
+    def test_precompiled_templates(self, templates_dir, output_dir, caplog):
+        context = {"title": "Compiled", "description": "From modules", "iteration_phase": "Initial Draft"}
+        compiled = compile_templates(str(templates_dir))
+        assert compiled.exists()
+        
+        generator = DocumentGenerator(str(templates_dir), str(output_dir))
+        assert "Title: Compiled" in generator.generate_document("Test Template", dict(context))
+        assert not caplog.records
+        
+        # Sources edited after the build win over the stale archive, with a warning
+        template_file = templates_dir / "test_template.md"
+        stat = compiled.stat()
+        template_file.write_text(template_file.read_text().replace("Title:", "Heading:"))
+        os.utime(template_file, (stat.st_atime, stat.st_mtime + 1))
+        
+        content = generator.generate_document("Test Template", dict(context))
+        assert "Heading: Compiled" in content
+        assert COMPILED_TEMPLATES in caplog.text
+
 class TestDocSeriesGenerator:
     """Test documentation series generation."""
     
@@ -160,6 +280,22 @@ class TestDocSeriesGenerator:
         assert status[1] is True
         assert status[2] is True
         assert status[3] is False
+    
+    def test_get_iteration_status_beyond_default(self, templates_dir, output_dir):
+        generator = DocSeriesGenerator(str(templates_dir), str(output_dir))
+        generator.generate_series(
+            "Test Template",
+            {"title": "Status Test", "description": "Testing status", "iteration_phase": "Initial Draft"},
+            iterations=5
+        )
+        
+        status = generator.get_iteration_status("Test Template")
+        assert status == {1: True, 2: True, 3: True, 4: True, 5: True}
+        assert generator.get_iteration_status("Test Template", iterations=6)[6] is False
+    
+    def test_get_iteration_status_unknown_template(self, templates_dir, output_dir):
+        generator = DocSeriesGenerator(str(templates_dir), str(output_dir))
+        assert generator.get_iteration_status("Missing Template") == {1: False, 2: False, 3: False}
 
 def test_end_to_end(templates_dir, output_dir):
     """Test complete documentation workflow."""
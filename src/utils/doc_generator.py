@@ -1,11 +1,102 @@
 """Documentation generator module."""
 
-from datetime import datetime
+import logging
+import os
+import time
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 import jinja2
 from .template_validator import TemplateValidator
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
+_ITERATION_PHASES = ("Unknown", "Initial Draft", "Refinement", "Final Review")
+
+# Generated date, refreshed at most once a minute
+_DATE_CACHE = {"t": float("-inf"), "v": ""}
+
+def _generated_date() -> str:
+    """Get today's date as YYYY-MM-DD, reformatting at most once a minute."""
+    now = time.monotonic()
+    if now - _DATE_CACHE["t"] > 60:
+        _DATE_CACHE["v"] = date.today().isoformat()
+        _DATE_CACHE["t"] = now
+    return _DATE_CACHE["v"]
+
+COMPILED_TEMPLATES = "_compiled_templates.zip"
+
+logger = logging.getLogger(__name__)
+
+class _CompiledTemplateLoader(jinja2.ModuleLoader):
+    """Load compile_templates() output, yielding to sources edited since the build."""
+
+    def __init__(self, archive: Path, templates_dir: str):
+        super().__init__(str(archive))
+        self.archive_mtime = archive.stat().st_mtime
+        self.templates_dir = templates_dir
+
+    def _is_stale(self, source: str) -> bool:
+        try:
+            return os.stat(source).st_mtime > self.archive_mtime
+        except FileNotFoundError:
+            return False
+
+    def load(self, environment, name, globals=None):
+        source = os.path.join(self.templates_dir, *name.split("/"))
+        if self._is_stale(source):
+            logger.warning(
+                f"Template {name} is newer than {COMPILED_TEMPLATES}; loading it "
+                f"from source. Rebuild with `make compile-doc-templates`."
+            )
+            raise jinja2.TemplateNotFound(name)
+        template = super().load(environment, name, globals)
+        # Compiled templates never expire on their own; expire on source edits
+        template._uptodate = lambda: not self._is_stale(source)
+        return template
+
+@lru_cache(maxsize=8)
+def _get_environment(templates_dir: str) -> jinja2.Environment:
+    """Get the shared Jinja environment for a templates directory.
+    
+    Templates precompiled by compile_templates() are loaded as Python
+    modules unless their source is newer than the archive; anything else is compiled from source, with bytecode cached
+    on disk and a stat per render to pick up edits. Set DOC_DEV=1 to
+    always load from source.
+    """
+    dev_mode = bool(os.environ.get("DOC_DEV"))
+    loader = jinja2.FileSystemLoader(templates_dir)
+    compiled = Path(templates_dir) / COMPILED_TEMPLATES
+    if compiled.exists() and not dev_mode:
+        # Templates added since the last build still load from source
+        loader = jinja2.ChoiceLoader([_CompiledTemplateLoader(compiled, templates_dir), loader])
+    return jinja2.Environment(
+        loader=loader,
+        autoescape=True,
+        auto_reload=True,
+        bytecode_cache=jinja2.FileSystemBytecodeCache()
+    )
+
+def compile_templates(templates_dir: str = "docs/templates") -> Path:
+    """Precompile all templates in a directory into a zip of Python modules.
+    
+    Run as a build step so DocumentGenerator does no template parsing at
+    runtime.
+    """
+    target = Path(templates_dir) / COMPILED_TEMPLATES
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(templates_dir),
+        autoescape=True
+    )
+    env.compile_templates(
+        str(target),
+        zip="stored",
+        filter_func=lambda name: not name.endswith((".yaml", ".zip")),
+        ignore_errors=False
+    )
+    return target
+
 class DocumentGenerator:
     """Generates documentation from templates."""
     
@@ -13,18 +104,22 @@ class DocumentGenerator:
         self.templates_dir = Path(templates_dir)
         self.output_dir = Path(output_dir)
         self.validator = TemplateValidator(templates_dir)
-        self.env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(str(self.templates_dir)),
-            autoescape=True
-        )
+        self.env = _get_environment(os.path.abspath(templates_dir))
 
-    def generate_document(self, template_name: str, context: Dict, iteration: int = 1) -> Optional[str]:
+    def generate_document(
+        self,
+        template_name: str,
+        context: Dict,
+        iteration: int = 1,
+        version: Optional[str] = None
+    ) -> Optional[str]:
         """Generate a document from a template.
         
         Args:
             template_name: Name of template to use
             context: Variables for template
             iteration: Current iteration (1-3)
+            version: Document version (defaults to "<iteration>.0.0")
             
         Returns:
             Generated document content or None if validation fails
@@ -43,8 +138,8 @@ class DocumentGenerator:
         context.update({
             "iteration": iteration,
             "iteration_phase": self._get_iteration_phase(iteration),
-            "generated_date": datetime.now().strftime("%Y-%m-%d"),
-            "version": f"{iteration}.0.0"
+            "generated_date": _generated_date(),
+            "version": version or f"{iteration}.0.0"
         })
 
         # Generate document
@@ -73,18 +168,31 @@ class DocumentGenerator:
         base_name = Path(template_config["file"]).stem
         output_file = self.output_dir / f"{base_name}_iter{iteration}.md"
         
-        # Save content
-        output_file.write_text(content)
+        # Save content with raw writes of the encoded bytes
+        data = memoryview(content.encode("utf-8"))
+        fd = os.open(output_file, _WRITE_FLAGS, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
         return output_file
 
     def _get_iteration_phase(self, iteration: int) -> str:
         """Get phase description for iteration."""
-        phases = {
-            1: "Initial Draft",
-            2: "Refinement",
-            3: "Final Review"
-        }
-        return phases.get(iteration, "Unknown")
+        return _ITERATION_PHASES[iteration if 1 <= iteration <= 3 else 0]
+
+@lru_cache(maxsize=8)
+def _cached_default_generator(cwd: str) -> DocumentGenerator:
+    return DocumentGenerator()
+
+def _default_generator() -> DocumentGenerator:
+    """Get the generator shared by the module-level helpers.
+    
+    Its default directories are relative, so one is kept per working
+    directory.
+    """
+    return _cached_default_generator(os.getcwd())
 
 def generate_deployment_doc(
     deployment_name: str,
@@ -93,7 +201,7 @@ def generate_deployment_doc(
     version: Optional[str] = None
 ) -> str:
     """Helper function to generate deployment documentation."""
-    generator = DocumentGenerator()
+    generator = _default_generator()
     content = generator.generate_document(
         "Deployment Guide",
         {
@@ -113,7 +221,7 @@ def generate_architecture_doc(
     version: Optional[str] = None
 ) -> str:
     """Helper function to generate architecture documentation."""
-    generator = DocumentGenerator()
+    generator = _default_generator()
     content = generator.generate_document(
         "Architecture Overview",
         {
@@ -133,7 +241,7 @@ def generate_resource_doc(
     version: Optional[str] = None
 ) -> str:
     """Helper function to generate resource documentation."""
-    generator = DocumentGenerator()
+    generator = _default_generator()
     content = generator.generate_document(
         "Resource Estimation",
         {
@@ -1,11 +1,24 @@
 """Helper functions for documentation generation."""
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 from .doc_generator import DocumentGenerator
 
+MAX_WORKERS = 4
+
+@lru_cache(maxsize=64)
+def _iteration_pattern(template_file: str) -> "re.Pattern[str]":
+    """Match the generated iteration files of a template file."""
+    base_name = os.path.splitext(os.path.basename(template_file))[0]
+    return re.compile(rf"{re.escape(base_name)}_iter(\d+)\.md")
+
 class DocSeriesGenerator:
     """Generates a series of documentation iterations."""
+    __slots__ = ("generator", "output_dir")
     
     def __init__(self, templates_dir: str = "docs/templates", output_dir: str = "docs/generated"):
         self.generator = DocumentGenerator(templates_dir, output_dir)
@@ -27,59 +40,95 @@ class DocSeriesGenerator:
         Returns:
             List of paths to generated documents
         """
-        generated_files = []
-        
-        for i in range(1, iterations + 1):
-            # Generate document for this iteration
-            content = self.generator.generate_document(
-                template_name,
-                context,
-                iteration=i
+        with ThreadPoolExecutor(max_workers=max(min(iterations, MAX_WORKERS), 1)) as executor:
+            results = executor.map(
+                lambda i: self._generate_iteration(template_name, context, i),
+                range(1, iterations + 1)
             )
-            
-            if content:
-                # Save document
-                output_file = self.generator.save_document(
-                    content,
-                    template_name,
-                    iteration=i
-                )
-                generated_files.append(output_file)
-            
-        return generated_files
+            return [output_file for output_file in results if output_file]
 
-    def get_iteration_status(self, template_name: str) -> Dict[int, bool]:
+    def _generate_iteration(self, template_name: str, context: Dict, iteration: int) -> Optional[Path]:
+        """Generate and save one iteration; None if the template fails validation."""
+        # generate_document updates the context, so each thread gets its own copy
+        content = self.generator.generate_document(
+            template_name,
+            dict(context),
+            iteration=iteration
+        )
+        if not content:
+            return None
+        return self.generator.save_document(content, template_name, iteration=iteration)
+
+    def get_iteration_status(self, template_name: str, iterations: int = 3) -> Dict[int, bool]:
         """Get status of iterations for a template.
         
+        Args:
+            template_name: Template to check
+            iterations: Iterations always reported, existing or not (default 3)
+            
         Returns:
             Dict mapping iteration number to whether it exists
         """
-        status = {}
-        template_config = self.generator.validator.config["templates"][template_name]
-        base_name = Path(template_config["file"]).stem
-        
-        # Check each iteration
-        for i in range(1, 4):
-            expected_file = self.output_dir / f"{base_name}_iter{i}.md"
-            status[i] = expected_file.exists()
+        template_config = self.generator.validator.config["templates"].get(template_name)
+        status = dict.fromkeys(range(1, iterations + 1), False)
+        if template_config is None:
+            return status
+            
+        pattern = _iteration_pattern(template_config["file"])
+        # List the output directory once, picking up iterations beyond the default too
+        try:
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    match = pattern.fullmatch(entry.name)
+                    if match:
+                        status[int(match.group(1))] = True
+        except FileNotFoundError:
+            pass
             
         return status
 
+@lru_cache(maxsize=32)
+def _cached_series_generator(templates_dir: str, output_dir: str, cwd: str) -> DocSeriesGenerator:
+    return DocSeriesGenerator(templates_dir, output_dir)
+
+def _get_series_generator(templates_dir: str, output_dir: str) -> DocSeriesGenerator:
+    """Get a series generator shared by helper calls with the same directories.
+    
+    Relative directories are resolved against the working directory, so
+    generators are shared per working directory too.
+    """
+    return _cached_series_generator(templates_dir, output_dir, os.getcwd())
+
+def _generate_series_paths(
+    template_name: str,
+    key: str,
+    name: str,
+    variables: Dict,
+    output_dir: str
+) -> List[Path]:
+    """Generate a documentation series with name stored under key in the context."""
+    generator = _get_series_generator("docs/templates", output_dir)
+    return generator.generate_series(template_name, {key: name, **variables})
+
+def _generate_series(
+    template_name: str,
+    key: str,
+    name: str,
+    variables: Dict,
+    output_dir: str
+) -> List[str]:
+    """Generate a documentation series, returning the paths as strings."""
+    return [str(f) for f in _generate_series_paths(template_name, key, name, variables, output_dir)]
+
 def generate_deployment_series(
     deployment_name: str,
     variables: Dict,
     output_dir: str = "docs/generated"
 ) -> List[str]:
     """Generate deployment documentation series."""
-    generator = DocSeriesGenerator(output_dir=output_dir)
-    files = generator.generate_series(
-        "Deployment Guide",
-        {
-            "deployment_name": deployment_name,
-            **variables
-        }
+    return _generate_series(
+        "Deployment Guide", "deployment_name", deployment_name, variables, output_dir
     )
-    return [f.as_posix() for f in files]
 
 def generate_architecture_series(
     component_name: str,
@@ -87,15 +136,9 @@ def generate_architecture_series(
     output_dir: str = "docs/generated"
 ) -> List[str]:
     """Generate architecture documentation series."""
-    generator = DocSeriesGenerator(output_dir=output_dir)
-    files = generator.generate_series(
-        "Architecture Overview",
-        {
-            "component_name": component_name,
-            **variables
-        }
+    return _generate_series(
+        "Architecture Overview", "component_name", component_name, variables, output_dir
     )
-    return [f.as_posix() for f in files]
 
 def generate_resource_series(
     resource_name: str,
@@ -103,12 +146,6 @@ def generate_resource_series(
     output_dir: str = "docs/generated"
 ) -> List[str]:
     """Generate resource documentation series."""
-    generator = DocSeriesGenerator(output_dir=output_dir)
-    files = generator.generate_series(
-        "Resource Estimation",
-        {
-            "resource_name": resource_name,
-            **variables
-        }
+    return _generate_series(
+        "Resource Estimation", "resource_name", resource_name, variables, output_dir
     )
-    return [f.as_posix() for f in files]
@@ -0,0 +1,34 @@
+"""Fast JSON serialization backed by orjson, with a stdlib fallback."""
+
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import date
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_APPEND_NEWLINE
+
+def _default(obj: Any) -> Any:
+    """Encode the types orjson handles natively."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes terminated by a newline."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_OPTIONS)
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode() + b"\n"
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
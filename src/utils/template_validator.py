@@ -1,21 +1,190 @@
 """Template validation for documentation system."""
 
+import atexit
+import hashlib
+import logging
+import mmap
+import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from . import fastjson
+
+try:
+    import ahocorasick
+except ImportError:  # Fall back to one substring search per pattern
+    ahocorasick = None
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available, use the pure-Python loader
+    from yaml import SafeLoader
+
+logger = logging.getLogger(__name__)
+
+# Set DOC_VALIDATION_CACHE to a writable file path to persist validation
+# results across runs; nothing is written to disk otherwise
+VALIDATION_CACHE = os.environ.get("DOC_VALIDATION_CACHE")
+
+class _ValidationDiskCache:
+    """Validation results, persisted across runs when given a path.
+    
+    The file is loaded on first access. Only the newest result per
+    template path is kept, and results for templates that no longer exist
+    are dropped on save, so the file stays bounded by the number of
+    templates. Without a path, results are only kept in memory.
+    """
+
+    def __init__(self, path: Optional[Path]):
+        self.path = path
+        self._entries: Optional[Dict[str, list]] = None
+        self._keys_by_path: Dict[str, str] = {}
+        self._dirty = False
+
+    def _load(self) -> Dict[str, list]:
+        if self._entries is None:
+            entries = {}
+            if self.path is not None:
+                # Pin the location so a later chdir doesn't move the save
+                self.path = self.path.absolute()
+                try:
+                    entries = fastjson.loads(self.path.read_bytes())
+                except (OSError, ValueError):
+                    pass
+            # Skip entries written in an older layout
+            self._entries = {
+                key: entry for key, entry in entries.items()
+                if isinstance(entry, list) and len(entry) == 3
+            }
+            self._keys_by_path = {entry[0]: key for key, entry in self._entries.items()}
+        return self._entries
+
+    def get(self, key: str) -> Optional[Tuple[bool, List[str]]]:
+        entry = self._load().get(key)
+        if entry is None:
+            return None
+        return entry[1], list(entry[2])
+
+    def put(self, key: str, template_path: str, is_valid: bool, errors: List[str]) -> None:
+        entries = self._load()
+        # A new key for the same template supersedes its previous result
+        old_key = self._keys_by_path.get(template_path)
+        if old_key is not None and old_key != key:
+            entries.pop(old_key, None)
+        self._keys_by_path[template_path] = key
+        entries[key] = [template_path, is_valid, list(errors)]
+        self._dirty = True
+
+    def save(self) -> None:
+        """Drop results for deleted templates and write the cache atomically."""
+        if self.path is None or not self._dirty:
+            return
+        entries = {
+            key: entry for key, entry in self._entries.items()
+            if os.path.exists(entry[0])
+        }
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(fastjson.dumps(entries))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            # Often run at exit, e.g. on a read-only filesystem; never fail there
+            logger.warning(f"Could not save template validation cache to {self.path}: {e}")
+            return
+        self._dirty = False
+
+_disk_cache = _ValidationDiskCache(Path(VALIDATION_CACHE) if VALIDATION_CACHE else None)
+atexit.register(_disk_cache.save)
+
+@lru_cache(maxsize=8)
+def _read_config(config_path: str, mtime_ns: int, size: int) -> Tuple[Dict, str]:
+    """Parse a templates config and hash its bytes; cached until the file changes."""
+    data = Path(config_path).read_bytes()
+    return yaml.load(data, Loader=SafeLoader), hashlib.sha1(data).hexdigest()
+
+@lru_cache(maxsize=16)
+def _build_automaton(patterns: Tuple[str, ...]) -> "ahocorasick.Automaton":
+    """Build an Aho-Corasick automaton matching any of the patterns."""
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+def _find_patterns(text: str, patterns: Tuple[str, ...]) -> FrozenSet[str]:
+    """Return the patterns occurring in text, in a single pass when possible."""
+    if ahocorasick is None or not patterns:
+        return frozenset(pattern for pattern in patterns if pattern in text)
+    return frozenset(match for _, match in _build_automaton(patterns).iter(text))
+
+def _scan_template(template_path: str, patterns: Tuple[str, ...]) -> FrozenSet[str]:
+    """Return the patterns occurring in a template file."""
+    if ahocorasick is not None:
+        return _find_patterns(Path(template_path).read_bytes().decode("utf-8"), patterns)
+    # One search per pattern either way, so scan the mapped file without copying it
+    with open(template_path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files cannot be mapped
+            return frozenset()
+        with mm:
+            return frozenset(
+                pattern for pattern in patterns if mm.find(pattern.encode("utf-8")) != -1
+            )
+
+def _check_template(
+    template_path: str,
+    required_sections: Tuple[str, ...],
+    variables: Tuple[str, ...]
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Find the required sections and variables missing from a template."""
+    placeholders = tuple(f"{{{{ {var} }}}}" for var in variables)
+    found = _scan_template(template_path, required_sections + placeholders)
+    missing_sections = tuple(
+        f"Missing required section: {section}"
+        for section in required_sections
+        if section not in found
+    )
+    missing_vars = tuple(
+        f"Template missing variable: {var}"
+        for var, placeholder in zip(variables, placeholders)
+        if placeholder not in found
+    )
+    return missing_sections, missing_vars
 
 class TemplateValidator:
     """Validates documentation templates."""
+    __slots__ = ("templates_dir", "_config_path", "_config", "_config_hash", "_template_paths")
     
     def __init__(self, templates_dir: str = "docs/templates"):
         self.templates_dir = Path(templates_dir)
-        self.config = self._load_config()
+        self._config_path = str((self.templates_dir / "templates_config.yaml").resolve())
+        self._config: Optional[Dict] = None
+        self._refresh_config()
+
+    @property
+    def config(self) -> Dict:
+        """Templates configuration, reloaded when the file changes."""
+        return self._refresh_config()
+
+    def _load_config(self) -> Tuple[Dict, str]:
+        """Load templates configuration and its content hash."""
+        stat = os.stat(self._config_path)
+        return _read_config(self._config_path, stat.st_mtime_ns, stat.st_size)
 
-    def _load_config(self) -> Dict:
-        """Load templates configuration."""
-        config_path = self.templates_dir / "templates_config.yaml"
-        with open(config_path, "r") as f:
-            return yaml.safe_load(f)
+    def _refresh_config(self) -> Dict:
+        """Re-stat the config, rebuilding derived state only when it changed."""
+        config, config_hash = self._load_config()
+        if config is not self._config:
+            self._config, self._config_hash = config, config_hash
+            # The cached config itself stays untouched
+            self._template_paths = {
+                name: str(self.templates_dir / template_config["file"])
+                for name, template_config in config["templates"].items()
+            }
+        return config
 
     def validate_template(self, template_name: str) -> Tuple[bool, List[str]]:
         """Validate a template against configuration rules.
@@ -23,45 +192,47 @@ class TemplateValidator:
         Returns:
             Tuple of (is_valid, list of errors)
         """
-        errors = []
-        template_config = self.config["templates"].get(template_name)
+        config = self.config
+        template_config = config["templates"].get(template_name)
         
         if not template_config:
             return False, [f"Template '{template_name}' not found in config"]
             
-        template_path = self.templates_dir / template_config["file"]
+        template_path = self._template_paths[template_name]
         
         # Check template file exists
-        if not template_path.exists():
+        try:
+            stat = os.stat(template_path)
+        except FileNotFoundError:
             return False, [f"Template file not found: {template_path}"]
             
-        # Check required sections
-        required_sections = self.config["validation_rules"]["required_sections"]
-        template_content = template_path.read_text()
-        
-        for section in required_sections:
-            if section not in template_content:
-                errors.append(f"Missing required section: {section}")
-
-        # Check template variables - only warn about missing variables
-        if "variables" in template_config:
-            missing_vars = []
-            for var in template_config["variables"]:
-                if f"{{{{ {var} }}}}" not in template_content:
-                    missing_vars.append(f"Template missing variable: {var}")
-            if missing_vars:
-                errors.extend(missing_vars)
+        # Results are reused until the template or config changes
+        key = hashlib.sha1(
+            f"{template_path}:{stat.st_mtime_ns}:{stat.st_size}:{self._config_hash}".encode()
+        ).hexdigest()
+        cached = _disk_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Check required sections, and warn about missing variables
+        missing_sections, missing_vars = _check_template(
+            template_path,
+            tuple(config["validation_rules"]["required_sections"]),
+            tuple(template_config.get("variables", ()))
+        )
 
         # Template is valid if it has all required sections
         # Variable warnings don't make it invalid
-        is_valid = all(not "Missing required section" in err for err in errors)
+        is_valid, errors = not missing_sections, [*missing_sections, *missing_vars]
+        _disk_cache.put(key, template_path, is_valid, errors)
         return is_valid, errors
 
     def get_template_requirements(self, template_name: str) -> Dict:
         """Get requirements for a template."""
-        template_config = self.config["templates"].get(template_name, {})
+        config = self.config
+        template_config = config["templates"].get(template_name, {})
         return {
-            "required_sections": self.config["validation_rules"]["required_sections"],
+            "required_sections": config["validation_rules"]["required_sections"],
             "variables": template_config.get("variables", []),
             "doctype": template_config.get("doctype", "")
         }